@@ -6,45 +6,127 @@ Draws a regular polygon (default: hexagon) that rotates smoothly over time.
 Key concepts demonstrated:
   - GLUT window creation and event loop.
   - 2D orthographic projection with gluOrtho2D.
-  - Drawing a GL_POLYGON with vertices placed using polar coordinates (radians).
-  - Time-based animation via idle callback and time.perf_counter().
+  - Polygon vertices placed using polar coordinates (radians) and uploaded
+    once into a Vertex Buffer Object (VBO).
+  - Drawing a convex polygon as a GL_TRIANGLE_FAN with glDrawArrays instead of
+    per-vertex glVertex calls.
+  - Rotating the geometry on the GPU: a minimal GLSL vertex shader applies
+    the angle passed as a uniform (falls back to glRotatef on the modelview
+    matrix when shaders are unavailable or USE_SHADER is False).
+  - Time-based animation via a ~60 Hz GLUT timer and time.perf_counter().
+  - Double buffering (GLUT_DOUBLE + glutSwapBuffers) for tear-free animation.
 
 The rotation angle is computed directly from wall-clock time in radians,
 so the polygon spins at a constant angular velocity regardless of frame rate.
+The vertices never change: only one uniform (or the modelview rotation) is
+updated per frame.
 """
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 from OpenGL.GLUT.freeglut import *
+from OpenGL.GL import shaders
+import ctypes
 import math
 import time
 import sys
+import numpy as np
 
 # -- Configuration --------------------------------------------------------------
 NUM_SIDES = 6        # Number of sides of the regular polygon
 RADIUS = 1.7         # Distance from center to each vertex
 ANGULAR_SPEED = 1.0  # Rotation speed in radians per second
+FRAME_INTERVAL_MS = 16  # Redraw period for the animation timer (~60 Hz)
 BG_COLOR = (0.6, 0.7, 0.82, 1.0)  # Light blue-grey background (RGBA)
 POLY_COLOR = (0.9, 0.2, 0.15)     # Red-orange polygon fill (RGB)
+USE_SHADER = True    # True -> rotate in a GLSL vertex shader; False -> glRotatef
+
+# -- Shaders (GLSL 1.20, compatible with the fixed-function matrices) -----------
+# The vertex shader rotates each vertex by the *angle* uniform (radians).
+# Vertices sit at (sin a, cos a), so a growing angle turns clockwise.
+VERTEX_SHADER = """
+#version 120
+uniform float angle;
+void main()
+{
+    float c = cos(angle);
+    float s = sin(angle);
+    vec2 p = mat2(c, -s, s, c) * gl_Vertex.xy;
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(p, 0.0, 1.0);
+    gl_FrontColor = gl_Color;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 120
+void main()
+{
+    gl_FragColor = gl_Color;
+}
+"""
+
+# -- Geometry -------------------------------------------------------------------
+def compute_poly(num_sides, radius):
+    """
+    Return the vertices of a regular polygon at rotation angle 0 as a
+    (num_sides, 2) float32 array.  Vertex i sits at angle i * (2pi / n)
+    radians.  Vectorised NumPy keeps this cheap even for hundreds of sides
+    (e.g. a smooth circle), and it only runs once at startup.
+    """
+    angles = np.arange(num_sides) * 2.0 * np.pi / num_sides
+    return radius * np.stack(
+        [np.sin(angles), np.cos(angles)], axis=1
+    ).astype(np.float32)
+
+
+POLY_VERTICES = compute_poly(NUM_SIDES, RADIUS)
 
 # -- Global state ---------------------------------------------------------------
 start_time = None  # Recorded once at startup; used as animation reference
+vbo_id = None      # Vertex buffer holding the polygon outline (set in init)
+program = None     # Linked rotation shader program, or None (fixed function)
+angle_loc = -1     # Location of the *angle* uniform in *program*
+
+
+def build_program():
+    """Compile and link the rotation shader; return None if GLSL fails."""
+    try:
+        return shaders.compileProgram(
+            shaders.compileShader(VERTEX_SHADER, GL_VERTEX_SHADER),
+            shaders.compileShader(FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+        )
+    except Exception as exc:
+        print("Shader unavailable, using glRotatef instead:", exc)
+        return None
 
 
 def init():
-    """One-time OpenGL setup: background colour and 2D projection."""
-    global start_time
+    """One-time OpenGL setup: background colour, 2D projection, the VBO and
+    (optionally) the rotation shader."""
+    global start_time, vbo_id, program, angle_loc
     glClearColor(*BG_COLOR)
     # Orthographic projection mapping world coords [-2, 2] to the viewport
     gluOrtho2D(-2.0, 2.0, -2.0, 2.0)
+
+    # Upload the geometry to the GPU once; every frame reuses it
+    vbo_id = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glBufferData(GL_ARRAY_BUFFER, POLY_VERTICES.nbytes, POLY_VERTICES,
+                 GL_STATIC_DRAW)
+
+    if USE_SHADER:
+        program = build_program()
+        if program is not None:
+            angle_loc = glGetUniformLocation(program, "angle")
+
     start_time = time.perf_counter()
 
 
 def display():
     """
     Called every frame.  Computes the current rotation angle in radians
-    from elapsed time and draws the polygon.
+    from elapsed time and draws the polygon stored in the VBO.
     """
     elapsed = time.perf_counter() - start_time
     # Current rotation angle (radians); increases linearly with time
@@ -53,32 +135,45 @@ def display():
     glClear(GL_COLOR_BUFFER_BIT)
     glColor3f(*POLY_COLOR)
 
-    # Draw a regular polygon centered at the origin
-    glBegin(GL_POLYGON)
-    for i in range(NUM_SIDES):
-        # Evenly-spaced vertex angle in radians: i * (2pi / n)
-        vertex_angle = angle_rad + i * 2.0 * math.pi / NUM_SIDES
-        x = RADIUS * math.sin(vertex_angle)
-        y = RADIUS * math.cos(vertex_angle)
-        glVertex2f(x, y)
-    glEnd()
-
-    glFlush()
-
-
-def idle():
-    """Idle callback: continuously requests a redisplay so the animation runs."""
+    glPushMatrix()
+    if program is not None:
+        # The vertex shader rotates every vertex in parallel on the GPU
+        glUseProgram(program)
+        glUniform1f(angle_loc, angle_rad)
+    else:
+        # Vertices sit at (sin a, cos a), so a growing angle turns clockwise:
+        # negate it for glRotatef, which expects degrees counter-clockwise.
+        glRotatef(-math.degrees(angle_rad), 0.0, 0.0, 1.0)
+
+    # Draw a regular polygon centered at the origin straight from the VBO
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(2, GL_FLOAT, 0, ctypes.c_void_p(0))
+    glDrawArrays(GL_TRIANGLE_FAN, 0, NUM_SIDES)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    if program is not None:
+        glUseProgram(0)
+    glPopMatrix()
+
+    glutSwapBuffers()  # Swap front and back buffers (double buffering)
+
+
+def timer(_value):
+    """Timer callback: requests a redisplay and re-arms itself (~60 Hz)."""
     glutPostRedisplay()
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
 
 
 # -- Main entry point ----------------------------------------------------------
 if __name__ == "__main__":
     glutInit(sys.argv)
-    glutInitDisplayMode(GLUT_SINGLE | GLUT_RGB)
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB)
     glutInitWindowPosition(300, 300)
     glutInitWindowSize(500, 500)
     glutCreateWindow(b"Rotating Polygon")
     init()
     glutDisplayFunc(display)
-    glutIdleFunc(idle)
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
     glutMainLoop()
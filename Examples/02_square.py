@@ -5,7 +5,10 @@ Draws a static coloured square (actually a frame shape) using GL_TRIANGLE_STRIP.
 
 Key concepts demonstrated:
   - Defining geometry with NumPy arrays of 2D vertices.
-  - Per-vertex colouring with glColor3fv / glVertex2fv.
+  - Per-vertex colouring: positions and colours interleaved as (x, y, r, g, b)
+    in a single Vertex Buffer Object (VBO) uploaded once at startup.
+  - Client-side vertex arrays (glVertexPointer / glColorPointer) pointing
+    into the VBO, drawn with one glDrawArrays call.
   - GL_TRIANGLE_STRIP primitive: pairs of outer and inner vertices form
     a continuous strip of triangles that together produce a coloured frame.
   - 2D orthographic projection with gluOrtho2D.
@@ -17,38 +20,60 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 from OpenGL.GLUT.freeglut import *
-from numpy import array
+import ctypes
+import numpy as np
 import sys
 
 # -- Geometry -------------------------------------------------------------------
 # 10 vertices alternate between outer and inner edges of the frame.
 # The strip closes by repeating the first pair at the end.
-vertices = array([
+vertices = np.array([
     [-1.0, -0.5], [-0.5, -0.25],   # bottom edge (outer, inner)
     [-1.0, +0.5], [-0.5, +0.25],   # left edge
     [+1.0, +0.5], [+0.5, +0.25],   # top edge
     [+1.0, -0.5], [+0.5, -0.25],   # right edge
     [-1.0, -0.5], [-0.5, -0.25],   # close the strip
-], dtype=float)
+], dtype=np.float32)
 
 # -- Per-vertex colours (RGB) --------------------------------------------------
 # Each vertex gets its own colour; OpenGL interpolates across each triangle.
-color = array([
+color = np.array([
     [1.0, 0.0, 0.0], [0.0, 1.0, 0.0],   # red / green
     [0.0, 0.0, 1.0], [1.0, 1.0, 0.0],   # blue / yellow
     [1.0, 0.0, 1.0], [0.0, 1.0, 1.0],   # magenta / cyan
     [0.5, 0.5, 0.5], [0.2, 0.2, 0.2],   # grey / dark grey
     [1.0, 0.0, 0.0], [0.0, 1.0, 0.0],   # red / green (closing pair)
-], dtype=float)
+], dtype=np.float32)
 
 NUM_VERTICES = len(vertices)  # Total vertices in the strip
 
+# Interleaved layout: 5 floats (x, y, r, g, b) per vertex, one contiguous
+# stream so every attribute of a vertex is fetched together
+interleaved = np.empty((NUM_VERTICES, 5), dtype=np.float32)
+interleaved[:, :2] = vertices
+interleaved[:, 2:] = color
+STRIDE = 5 * 4          # Bytes between consecutive vertices
+COLOR_OFFSET = 2 * 4    # Byte offset of (r, g, b) inside each vertex
+# Buffer offsets wrapped once as ctypes pointers for gl*Pointer
+VERTEX_PTR = ctypes.c_void_p(0)
+COLOR_PTR = ctypes.c_void_p(COLOR_OFFSET)
+
+# -- Global state ---------------------------------------------------------------
+vbo_id = None  # Vertex buffer object holding the interleaved data (set in init)
+
 
 def init():
-    """One-time OpenGL setup: background colour and 2D projection."""
+    """One-time OpenGL setup: background colour, 2D projection and the VBO."""
+    global vbo_id
     glClearColor(0.6, 0.7, 0.82, 1.0)       # Light blue-grey background
     gluOrtho2D(-2.0, 2.0, -2.0, 2.0)        # Orthographic projection
 
+    # Upload the interleaved positions and colours to the GPU once
+    vbo_id = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glBufferData(GL_ARRAY_BUFFER, interleaved.nbytes, interleaved,
+                 GL_STATIC_DRAW)
+
 
 def square():
     """
@@ -57,12 +82,16 @@ def square():
     """
     glClear(GL_COLOR_BUFFER_BIT)
 
-    # Draw the frame as a continuous triangle strip
-    glBegin(GL_TRIANGLE_STRIP)
-    for i in range(NUM_VERTICES):
-        glColor3fv(color[i])       # Set colour for this vertex
-        glVertex2fv(vertices[i])   # Emit the vertex
-    glEnd()
+    # Draw the frame as a continuous triangle strip read from the VBO
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_COLOR_ARRAY)
+    glVertexPointer(2, GL_FLOAT, STRIDE, VERTEX_PTR)
+    glColorPointer(3, GL_FLOAT, STRIDE, COLOR_PTR)
+    glDrawArrays(GL_TRIANGLE_STRIP, 0, NUM_VERTICES)
+    glDisableClientState(GL_COLOR_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
 
     glFlush()  # Force execution of all GL commands
 
@@ -5,10 +5,16 @@ A coloured square that rotates and scrolls horizontally, wrapping seamlessly
 from right to left so it never disappears.
 
 Key concepts demonstrated:
-  - Time-based animation with radians (converted to degrees only for glRotatef).
+  - Time-based animation with radians (converted to degrees only for glRotatef),
+    redrawn from a ~60 Hz GLUT timer instead of a busy idle loop.  Angle and
+    position are accumulated per frame and wrapped, so they stay bounded no
+    matter how long the program runs.
   - glPushMatrix / glPopMatrix to isolate transformations.
-  - Seamless horizontal wrapping by drawing three offset copies of the shape.
-  - GL_TRIANGLE_STRIP with per-vertex colour.
+  - Seamless horizontal wrapping by drawing offset copies of the shape, only
+    for the copies that can actually overlap the viewport.
+  - Double buffering (GLUT_DOUBLE + glutSwapBuffers) for smooth animation.
+  - GL_TRIANGLE_STRIP with per-vertex colour, stored interleaved in a
+    Vertex Buffer Object (VBO) uploaded once and drawn with glDrawArrays.
 
 All internal angles are stored and computed in **radians**.
 The only conversion to degrees happens at the glRotatef call, which requires it.
@@ -18,7 +24,8 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 from OpenGL.GLUT.freeglut import *
-from numpy import array
+import ctypes
+import numpy as np
 import math
 import time
 import sys
@@ -28,95 +35,144 @@ ROTATION_SPEED = math.pi / 3.0  # Rotation speed: pi/3 rad/s  (~ 60deg/s)
 SCROLL_SPEED = 0.7              # Horizontal translation speed (units/s)
 VIEWPORT_HALF = 2.0             # Orthographic range: [-2, +2]
 VIEWPORT_WIDTH = 2.0 * VIEWPORT_HALF  # Total visible width = 4.0 units
+FRAME_INTERVAL_MS = 16          # Redraw period for the animation timer (~60 Hz)
+TWO_PI = 2.0 * math.pi          # Full turn in radians (wrap-around period)
 
 # -- Geometry -------------------------------------------------------------------
 # 10 vertices: pairs of (outer, inner) forming a frame via GL_TRIANGLE_STRIP.
 # The last pair repeats the first to close the shape.
-vertices = array([
+vertices = np.array([
     [-1.0, -1.0], [-0.5, -0.5],
     [-1.0, +1.0], [-0.5, +0.5],
     [+1.0, +1.0], [+0.5, +0.5],
     [+1.0, -1.0], [+0.5, -0.5],
     [-1.0, -1.0], [-0.5, -0.5],
-], dtype=float)
+], dtype=np.float32)
 
 # -- Per-vertex RGB colours ----------------------------------------------------
-color = array([
+color = np.array([
     [+1.0, +0.0, +0.0], [+1.0, +0.0, +0.0],   # red
     [+0.0, +0.0, +1.0], [+0.0, +0.0, +1.0],   # blue
     [+1.0, +0.0, +1.0], [+1.0, +0.0, +1.0],   # magenta
     [+0.0, +1.0, +0.0], [+0.0, +1.0, +0.0],   # green
     [+1.0, +0.0, +0.0], [+1.0, +0.0, +0.0],   # red (closing pair)
-], dtype=float)
+], dtype=np.float32)
 
 NUM_VERTICES = len(vertices)
 
+# Interleaved layout: 5 floats (x, y, r, g, b) per vertex, one contiguous
+# stream so every attribute of a vertex is fetched together
+interleaved = np.empty((NUM_VERTICES, 5), dtype=np.float32)
+interleaved[:, :2] = vertices
+interleaved[:, 2:] = color
+STRIDE = 5 * 4          # Bytes between consecutive vertices
+COLOR_OFFSET = 2 * 4    # Byte offset of (r, g, b) inside each vertex
+# Buffer offsets wrapped once as ctypes pointers for gl*Pointer
+VERTEX_PTR = ctypes.c_void_p(0)
+COLOR_PTR = ctypes.c_void_p(COLOR_OFFSET)
+
 # -- Global state ---------------------------------------------------------------
-start_time = None  # Set once in init(); reference for elapsed time
+last_time = None  # Previous frame timestamp (seconds); set in init()
+angle_rad = 0.0    # Current rotation angle, wrapped to [0, 2pi)
+scroll_x = 0.0     # Horizontal scroll distance, wrapped to [0, VIEWPORT_WIDTH)
+vbo_id = None      # Vertex buffer object with the interleaved square data
 
 
 def init():
-    """Set up background colour, orthographic projection, and start timer."""
-    global start_time
+    """Set up background colour, orthographic projection, VBO and timer."""
+    global last_time, vbo_id
     glClearColor(+0.6, +0.7, +0.82, +1.0)                # Light blue-grey
     gluOrtho2D(-VIEWPORT_HALF, +VIEWPORT_HALF,
                -VIEWPORT_HALF, +VIEWPORT_HALF)             # 2D projection
-    start_time = time.perf_counter()
+
+    # Upload the interleaved positions and colours to the GPU once
+    vbo_id = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glBufferData(GL_ARRAY_BUFFER, interleaved.nbytes, interleaved,
+                 GL_STATIC_DRAW)
+
+    # Point the vertex and colour arrays into the VBO once.  The square is
+    # the only geometry in the scene, so this state stays bound; per frame
+    # only the modelview matrix changes.
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_COLOR_ARRAY)
+    glVertexPointer(2, GL_FLOAT, STRIDE, VERTEX_PTR)
+    glColorPointer(3, GL_FLOAT, STRIDE, COLOR_PTR)
+    last_time = time.perf_counter()
+
+
+def update_state():
+    """Advance rotation and scroll by the real time since the last frame."""
+    global last_time, angle_rad, scroll_x
+    current = time.perf_counter()
+    dt = current - last_time
+    last_time = current
+    # Accumulate and wrap: values stay small, so precision never degrades
+    angle_rad = (angle_rad + ROTATION_SPEED * dt) % TWO_PI
+    scroll_x = (scroll_x + SCROLL_SPEED * dt) % VIEWPORT_WIDTH
 
 
 def display():
     """
     Display callback.
-    1. Computes elapsed time.
-    2. Derives rotation angle (radians) and horizontal offset.
-    3. Draws three copies of the shape (left, centre, right) so wrapping
+    1. Advances the rotation angle (radians) and horizontal offset.
+    2. Converts them to the values used by glRotatef / glTranslatef.
+    3. Draws the shape plus one wrapped copy (left or right) so wrapping
        is perfectly seamless -- as one copy exits the viewport on the right,
-       the next is already entering from the left.
+       the next is already entering from the left.  The copy on the far
+       side lies entirely outside the viewport and is skipped.
     """
     glClear(GL_COLOR_BUFFER_BIT)
 
-    elapsed = time.perf_counter() - start_time
+    update_state()
 
-    # Rotation angle in radians; increases at ROTATION_SPEED rad/s
-    angle_rad = (elapsed * ROTATION_SPEED) % (2.0 * math.pi)
+    # glRotatef requires degrees -> convert once here, shared by every copy
+    angle_deg = math.degrees(angle_rad)
 
     # Horizontal position: wraps within [-VIEWPORT_HALF, +VIEWPORT_HALF]
-    x = (elapsed * SCROLL_SPEED) % VIEWPORT_WIDTH - VIEWPORT_HALF
+    x = scroll_x - VIEWPORT_HALF
+
+    # Only the centre copy and the one on the side it is moving away from
+    # can intersect the viewport; the third is always fully off-screen.
+    visible_offsets = [0.0]
+    if x > 0.0:
+        visible_offsets.append(-VIEWPORT_WIDTH)
+    elif x < 0.0:
+        visible_offsets.append(+VIEWPORT_WIDTH)
 
-    # Draw three offset copies for seamless wrap-around
-    for offset in [-VIEWPORT_WIDTH, 0.0, +VIEWPORT_WIDTH]:
+    for offset in visible_offsets:
         glPushMatrix()
         glTranslatef(x + offset, +0.0, +0.0)
-        # glRotatef requires degrees -> convert only here
-        glRotatef(math.degrees(angle_rad), +0.0, +0.0, +1.0)
+        glRotatef(angle_deg, +0.0, +0.0, +1.0)
         draw_square()
         glPopMatrix()
 
-    glFlush()
+    glutSwapBuffers()  # Swap front and back buffers (double buffering)
 
 
-def idle():
-    """Request continuous redisplay to keep the animation running."""
+def timer(_value):
+    """Request a redisplay and re-arm the timer (~60 Hz animation)."""
     glutPostRedisplay()
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
 
 
 def draw_square():
-    """Draw the coloured frame shape using a triangle strip."""
-    glBegin(GL_TRIANGLE_STRIP)
-    for i in range(NUM_VERTICES):
-        glColor3fv(color[i])
-        glVertex2fv(vertices[i])
-    glEnd()
+    """Draw the coloured frame shape from the VBO as a triangle strip.
+
+    The vertex arrays were bound in init(); the current modelview matrix
+    (set by the caller) places and rotates the shape on the GPU.
+    """
+    glDrawArrays(GL_TRIANGLE_STRIP, 0, NUM_VERTICES)
 
 
 # -- Main entry point ----------------------------------------------------------
 if __name__ == "__main__":
     glutInit(sys.argv)
-    glutInitDisplayMode(GLUT_SINGLE | GLUT_RGB)
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGB)
     glutInitWindowPosition(+300, +300)
     glutInitWindowSize(+500, +500)
     glutCreateWindow(b"Rotating & Scrolling Square")
     init()
     glutDisplayFunc(display)
-    glutIdleFunc(idle)
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
     glutMainLoop()
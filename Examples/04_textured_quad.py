@@ -4,8 +4,10 @@
 Displays a textured quad (square) using an image loaded with PIL.
 
 Key concepts demonstrated:
-  - Loading an image with PIL and uploading it to OpenGL as a 2D texture.
+  - Loading an image with PIL and uploading it to OpenGL as a 2D texture
+    object once at startup (glGenTextures / glBindTexture).
   - Mapping texture coordinates (u, v) to quad vertices.
+  - Interleaved (x, y, u, v) vertex data stored in a Vertex Buffer Object.
   - GL_QUADS primitive for drawing a textured rectangle.
   - 2D orthographic projection.
 
@@ -15,55 +17,88 @@ No animation -- this is a static textured scene.
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
+import ctypes
 import sys
+import numpy as np
 from PIL import Image
 
 # -- Configuration --------------------------------------------------------------
 TEXTURE_PATH = "img/box.jpg"
 
 # -- Texture data (loaded at module level for simplicity) ----------------------
-image = Image.open(TEXTURE_PATH)
+image = Image.open(TEXTURE_PATH).convert("RGBA")
 tex_width = image.size[0]       # Texture width in pixels
 tex_height = image.size[1]      # Texture height in pixels
-tex_bytes = image.tobytes("raw", "RGBX", 0, -1)  # Raw pixel data
+# Raw RGBA pixels as a (h, w, 4) uint8 array, rows flipped bottom-up for
+# OpenGL; .copy() makes the reversed view C-contiguous for glTexImage2D
+tex_bytes = np.asarray(image)[::-1].copy()
+
+# -- Geometry -------------------------------------------------------------------
+# Interleaved vertex data: 4 floats (x, y, u, v) per vertex
+QUAD = np.array([
+    #  x     y     u    v
+    [-1.0, -1.0, 0.0, 0.0],   # bottom-left
+    [-1.0, +1.0, 0.0, 1.0],   # top-left
+    [+1.0, +1.0, 1.0, 1.0],   # top-right
+    [+1.0, -1.0, 1.0, 0.0],   # bottom-right
+], dtype=np.float32)
+STRIDE = 4 * 4              # Bytes between consecutive vertices
+TEXCOORD_OFFSET = 2 * 4     # Byte offset of (u, v) inside each vertex
+
+# -- Global state ---------------------------------------------------------------
+vbo_id = None  # Vertex buffer object holding QUAD (set in init)
+tex_id = None  # Texture object holding the image (set in init)
 
 
 def init():
-    """Set up background colour, 2D projection, and texture parameters."""
+    """Set up background colour, 2D projection, the texture and quad VBO."""
+    global vbo_id, tex_id
     glClearColor(1.0, 1.0, 1.0, 0.0)       # White background
     glMatrixMode(GL_PROJECTION)
     gluOrtho2D(-2.0, 2.0, -2.0, 2.0)       # Orthographic projection
     glMatrixMode(GL_MODELVIEW)
 
+    # Upload the quad geometry to the GPU once
+    vbo_id = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glBufferData(GL_ARRAY_BUFFER, QUAD.nbytes, QUAD, GL_STATIC_DRAW)
 
-def draw_textured_quad():
-    """
-    Display callback.
-    Uploads the texture each frame (simple approach) and draws a quad
-    spanning [-1, 1] in both axes with full texture mapping [0, 1]^2.
-    """
-    glClear(GL_COLOR_BUFFER_BIT)
+    # Create the texture object and upload the image to the GPU once
+    tex_id = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, tex_id)
 
     # Set texture filtering: nearest-neighbour (sharp, pixel-art style)
-    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
-    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
 
-    # Upload the texture image to the GPU
+    # Sized GL_RGBA8 storage matches the RGBA source bytes: no conversion
     glTexImage2D(
-        GL_TEXTURE_2D, 0, 3,
+        GL_TEXTURE_2D, 0, GL_RGBA8,
         tex_width, tex_height, 0,
         GL_RGBA, GL_UNSIGNED_BYTE, tex_bytes,
     )
 
-    # Enable texturing, draw the quad, then disable texturing
+
+def draw_textured_quad():
+    """
+    Display callback.
+    Binds the texture uploaded in init() and draws a quad spanning
+    [-1, 1] in both axes with full texture mapping [0, 1]^2.
+    """
+    glClear(GL_COLOR_BUFFER_BIT)
+
+    # Enable texturing, draw the quad from the VBO, then disable texturing
+    glBindTexture(GL_TEXTURE_2D, tex_id)
     glEnable(GL_TEXTURE_2D)
-    glBegin(GL_QUADS)
-    #        tex coord (u,v)        vertex (x, y)
-    glTexCoord2f(0.0, 0.0);  glVertex2f(-1.0, -1.0)   # bottom-left
-    glTexCoord2f(0.0, 1.0);  glVertex2f(-1.0, +1.0)   # top-left
-    glTexCoord2f(1.0, 1.0);  glVertex2f(+1.0, +1.0)   # top-right
-    glTexCoord2f(1.0, 0.0);  glVertex2f(+1.0, -1.0)   # bottom-right
-    glEnd()
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+    glVertexPointer(2, GL_FLOAT, STRIDE, ctypes.c_void_p(0))
+    glTexCoordPointer(2, GL_FLOAT, STRIDE, ctypes.c_void_p(TEXCOORD_OFFSET))
+    glDrawArrays(GL_QUADS, 0, len(QUAD))
+    glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
     glDisable(GL_TEXTURE_2D)
 
     glFlush()
@@ -4,7 +4,9 @@
 Textures a regular polygon of N sides using a polar texture-coordinate mapping.
 
 Key concepts demonstrated:
-  - Regular polygon vertices computed with trigonometry (radians).
+  - Regular polygon vertices computed with vectorised NumPy trigonometry
+    (radians), stored as interleaved (u, v, x, y, z) data in a Vertex Buffer
+    Object (VBO) and drawn with glInterleavedArrays(GL_T2F_V3F).
   - Polar texture mapping: each vertex gets (u, v) based on its angle from
     the polygon centre, centred at (0.5, 0.5) in texture space.
   - GL_REPEAT vs GL_CLAMP_TO_EDGE wrap modes -- see what happens when texture
@@ -18,8 +20,9 @@ and observe how the wrap mode affects the result.
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
+import ctypes
 import sys
-import math
+import numpy as np
 from PIL import Image
 
 # -- Configuration --------------------------------------------------------------
@@ -34,17 +37,41 @@ tex_width = None
 tex_height = None
 tex_bytes = None
 
+# -- Geometry -------------------------------------------------------------------
+# Vertex angles in radians: evenly spaced around the circle
+_theta = np.linspace(0.0, 2.0 * np.pi, N_SIDES, endpoint=False)
+_cos_t = np.cos(_theta)
+_sin_t = np.sin(_theta)
+
+# Interleaved GL_T2F_V3F layout: (u, v, x, y, z) per vertex.
+#   - (x, y): world-space position (polar -> cartesian), z = 0.
+#   - (u, v): texture coordinates centred at (0.5, 0.5).  COORD_SCALE > 1.0
+#     pushes coords outside [0, 1] to demonstrate GL_REPEAT vs
+#     GL_CLAMP_TO_EDGE.
+POLY_VERTICES = np.column_stack([
+    0.5 + 0.5 * _cos_t * COORD_SCALE,
+    0.5 + 0.5 * _sin_t * COORD_SCALE,
+    RADIUS * _cos_t,
+    RADIUS * _sin_t,
+    np.zeros(N_SIDES),
+]).astype(np.float32)
+
+# -- Global state ---------------------------------------------------------------
+vbo_id = None  # Vertex buffer object holding the polygon (set in init)
+
 
 def load_texture():
-    """Load the texture image from disk and convert to raw RGBA bytes."""
+    """Load the texture image from disk and convert to an RGBA pixel array."""
     global tex_width, tex_height, tex_bytes
     image = Image.open(TEXTURE_PATH).convert("RGBA")
     tex_width, tex_height = image.size
-    tex_bytes = image.tobytes("raw", "RGBA", 0, -1)
+    # Rows flipped bottom-up for OpenGL; .copy() keeps the array C-contiguous
+    tex_bytes = np.asarray(image)[::-1].copy()
 
 
 def init():
-    """Set up background colour, 2D projection, and texture parameters."""
+    """Set up background colour, 2D projection, texture and polygon VBO."""
+    global vbo_id
     glClearColor(0.9, 0.9, 0.95, 1.0)      # Near-white background
     glMatrixMode(GL_PROJECTION)
     gluOrtho2D(-2.0, 2.0, -2.0, 2.0)       # Orthographic projection
@@ -64,34 +91,29 @@ def init():
         GL_RGBA, GL_UNSIGNED_BYTE, tex_bytes,
     )
 
+    # Upload the precomputed vertex table to the GPU once
+    vbo_id = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glBufferData(GL_ARRAY_BUFFER, POLY_VERTICES.nbytes, POLY_VERTICES,
+                 GL_STATIC_DRAW)
+
 
 def draw_textured_polygon():
     """
     Display callback.
-    Draws a regular N-sided polygon with texture coordinates derived from
-    polar mapping around the polygon centre.
+    Draws the regular N-sided polygon stored in the VBO.
     """
     glClear(GL_COLOR_BUFFER_BIT)
     glEnable(GL_TEXTURE_2D)
 
-    glBegin(GL_POLYGON)
-    for i in range(N_SIDES):
-        # Vertex angle in radians: evenly spaced around the circle
-        theta = 2.0 * math.pi * i / N_SIDES
-
-        # World-space vertex position (polar -> cartesian)
-        x = RADIUS * math.cos(theta)
-        y = RADIUS * math.sin(theta)
-
-        # Texture coordinates centred at (0.5, 0.5).
-        # COORD_SCALE > 1.0 pushes coords outside [0, 1] to demonstrate
-        # the effect of GL_REPEAT vs GL_CLAMP_TO_EDGE.
-        u = 0.5 + 0.5 * math.cos(theta) * COORD_SCALE
-        v = 0.5 + 0.5 * math.sin(theta) * COORD_SCALE
-
-        glTexCoord2f(u, v)
-        glVertex2f(x, y)
-    glEnd()
+    # glInterleavedArrays enables and points both client arrays in one call
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glInterleavedArrays(GL_T2F_V3F, 0, ctypes.c_void_p(0))
+    # Convex polygon -> triangle fan (same pixels as GL_POLYGON, simpler path)
+    glDrawArrays(GL_TRIANGLE_FAN, 0, N_SIDES)
+    glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
 
     glDisable(GL_TEXTURE_2D)
     glFlush()
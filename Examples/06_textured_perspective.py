@@ -6,17 +6,22 @@ Displays a textured square in 3D perspective that rotates around the Y axis.
 Key concepts demonstrated:
   - gluPerspective for perspective projection (replaces glFrustum).
   - Reshape callback to keep the aspect ratio correct when the window is resized.
-  - Time-based rotation stored internally in radians; converted to degrees only
-    for glRotatef.
+  - Time-based rotation stored internally in radians and applied with
+    glMultMatrixf from a Y-rotation matrix built directly from cos/sin.
   - Double buffering (GLUT_DOUBLE) for smooth animation.
   - Depth testing (GL_DEPTH_TEST) to handle correct face ordering.
+  - Quad stored as interleaved (u, v, x, y, z) data in a Vertex Buffer Object
+    and drawn with glInterleavedArrays + glDrawArrays.
 """
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
+import ctypes
 import sys
 import math
+import time
+import numpy as np
 from PIL import Image
 
 # -- Configuration --------------------------------------------------------------
@@ -27,29 +32,42 @@ FAR_PLANE = 100.0         # Distance to the far clipping plane
 WINDOW_W = 750
 WINDOW_H = 750
 ROTATION_SPEED = math.pi / 10.0  # Rotation speed: pi/10 rad/s (~ 18deg/s)
+FRAME_INTERVAL_MS = 16    # Animation timer period (~60 Hz)
 
 # -- Geometry (square lying in the XY plane, z = 0) ----------------------------
-quad_texcoords = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
-quad_vertices = [(-1.0, -1.0, 0.0), (1.0, -1.0, 0.0),
-                 (1.0, 1.0, 0.0), (-1.0, 1.0, 0.0)]
+# Interleaved GL_T2F_V3F layout: (u, v, x, y, z) per vertex
+QUAD = np.array([
+    [0.0, 0.0, -1.0, -1.0, 0.0],
+    [1.0, 0.0, +1.0, -1.0, 0.0],
+    [1.0, 1.0, +1.0, +1.0, 0.0],
+    [0.0, 1.0, -1.0, +1.0, 0.0],
+], dtype=np.float32)
 
 # -- Global state ---------------------------------------------------------------
 angle_rad = 0.0           # Current rotation angle in radians
 last_time = None           # Previous frame timestamp (seconds)
 tex_w = tex_h = None
 tex_bytes = None
+vbo_id = None              # Vertex buffer holding QUAD (set in init)
+# Column-major 4x4 Y-axis rotation, updated in place each frame (see display)
+rot_y = (ctypes.c_float * 16)(1.0, 0.0, 0.0, 0.0,
+                              0.0, 1.0, 0.0, 0.0,
+                              0.0, 0.0, 1.0, 0.0,
+                              0.0, 0.0, 0.0, 1.0)
 
 
 def load_texture():
-    """Load an image from disk and store its raw RGBA pixel data."""
+    """Load an image from disk and store its RGBA pixel array."""
     global tex_w, tex_h, tex_bytes
     image = Image.open(TEXTURE_PATH).convert("RGBA")
     tex_w, tex_h = image.size
-    tex_bytes = image.tobytes("raw", "RGBA", 0, -1)
+    # Rows flipped bottom-up for OpenGL; .copy() keeps the array C-contiguous
+    tex_bytes = np.asarray(image)[::-1].copy()
 
 
 def init():
-    """One-time OpenGL setup: background, depth test, and texture upload."""
+    """One-time OpenGL setup: background, depth test, texture and VBO."""
+    global vbo_id
     glClearColor(0.0, 0.0, 0.2, 1.0)       # Dark blue background
     glEnable(GL_DEPTH_TEST)                  # Enable depth testing
 
@@ -68,6 +86,12 @@ def init():
 
     glGenerateMipmap(GL_TEXTURE_2D)
 
+    # Upload the quad to the GPU once
+    vbo_id = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glBufferData(GL_ARRAY_BUFFER, QUAD.nbytes, QUAD, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
 
 def reshape(w, h):
     """
@@ -88,7 +112,7 @@ def reshape(w, h):
 def update_angle():
     """Advance the rotation angle based on real elapsed time (radians)."""
     global angle_rad, last_time
-    current = glutGet(GLUT_ELAPSED_TIME) / 1000.0  # milliseconds -> seconds
+    current = time.perf_counter()  # seconds, no GLUT round-trip
     if last_time is None:
         last_time = current
     dt = current - last_time
@@ -114,24 +138,32 @@ def display():
     # Move the scene away from the camera so it is visible
     glTranslatef(0.0, 0.0, -6.0)
 
-    # Rotate around Y axis -- convert radians -> degrees for glRotatef
-    glRotatef(math.degrees(angle_rad), 0.0, 1.0, 0.0)
+    # Rotate around Y axis: the angle is already in radians, so fill in the
+    # rotation matrix directly (one cos + one sin) instead of glRotatef
+    c = math.cos(angle_rad)
+    s = math.sin(angle_rad)
+    rot_y[0], rot_y[2] = c, -s
+    rot_y[8], rot_y[10] = s, c
+    glMultMatrixf(rot_y)
 
-    # Draw the textured quad
+    # Draw the textured quad from the VBO; glInterleavedArrays enables and
+    # points both client arrays in one call
     glEnable(GL_TEXTURE_2D)
-    glBegin(GL_QUADS)
-    for (u, v), (x, y, z) in zip(quad_texcoords, quad_vertices):
-        glTexCoord2f(u, v)
-        glVertex3f(x, y, z)
-    glEnd()
+    glBindBuffer(GL_ARRAY_BUFFER, vbo_id)
+    glInterleavedArrays(GL_T2F_V3F, 0, ctypes.c_void_p(0))
+    glDrawArrays(GL_QUADS, 0, 4)
+    glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
     glDisable(GL_TEXTURE_2D)
 
     glutSwapBuffers()  # Swap front and back buffers (double buffering)
 
 
-def idle():
-    """Request continuous redisplay for animation."""
+def timer(_value):
+    """Timer callback: requests a redisplay and re-arms itself (~60 Hz)."""
     glutPostRedisplay()
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
 
 
 # -- Main entry point ----------------------------------------------------------
@@ -146,5 +178,5 @@ if __name__ == "__main__":
     reshape(WINDOW_W, WINDOW_H)
     glutDisplayFunc(display)
     glutReshapeFunc(reshape)
-    glutIdleFunc(idle)
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
     glutMainLoop()
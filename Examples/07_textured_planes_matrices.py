@@ -7,20 +7,27 @@ Two textured planes in 3D perspective:
 
 Key concepts demonstrated:
   - gluPerspective for perspective projection.
-  - glPushMatrix / glPopMatrix to isolate hierarchical transformations:
-    the orbiting plane's transform is built on top of the scene's base
-    transform without affecting Plane A.
-  - glGetDoublev(GL_PROJECTION_MATRIX) to inspect the projection matrix
-    and verify that it is NOT affine (last row != [0 0 0 1]).
-  - Internal angles stored in radians; converted to degrees only for glRotatef.
-  - Display list for efficient repeated drawing.
+  - push / pop on a small NumPy matrix stack to isolate hierarchical
+    transformations: the orbiting plane's transform is built on top of the
+    scene's base transform without affecting Plane A.  Each draw uploads
+    its final model-view matrix with a single glLoadMatrixf instead of a
+    chain of glPushMatrix / glTranslatef / glRotatef / glPopMatrix calls.
+  - The gluPerspective projection matrix, rebuilt in Python from its closed
+    form and printed to verify that it is NOT affine (last row != [0 0 0 1]).
+    Computing it locally avoids a glGet* read-back, which stalls the pipeline.
+  - All angles stay in radians; the rotation matrices are built from cos/sin.
+  - Vertex Buffer Object (VBO) uploaded once and drawn with glDrawArrays;
+    the texture is uploaded once into a texture object.
 """
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
+import ctypes
 import sys
 import math
+import time
+import numpy as np
 from PIL import Image
 
 # -- Configuration --------------------------------------------------------------
@@ -35,14 +42,24 @@ WINDOW_H = 550
 SELF_SPIN_SPEED = 2.0 * math.pi / 9.0   # ~ 40deg/s  (self-rotation)
 ORBIT_SPEED = 2.0 * math.pi / 18.0      # ~ 20deg/s  (orbit around plane A)
 ORBIT_RADIUS = 20.0                      # Distance of orbiting plane from origin
+TWO_PI = 2.0 * math.pi                   # Full turn (radians)
+FRAME_INTERVAL_MS = 16                   # Animation timer period (~60 Hz)
 
 # -- Geometry (square in the XY plane) -----------------------------------------
-QUAD_TEXCOORDS = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
-QUAD_VERTICES = [(-1.0, -1.0, 0.0), (1.0, -1.0, 0.0),
-                 (1.0, 1.0, 0.0), (-1.0, 1.0, 0.0)]
+# Interleaved layout: 5 floats (x, y, z, u, v) per vertex
+QUAD = np.array([
+    [-1.0, -1.0, 0.0, 0.0, 0.0],
+    [+1.0, -1.0, 0.0, 1.0, 0.0],
+    [+1.0, +1.0, 0.0, 1.0, 1.0],
+    [-1.0, +1.0, 0.0, 0.0, 1.0],
+], dtype=np.float32)
+STRIDE = 5 * 4                          # Bytes between consecutive vertices
+VERTEX_PTR = ctypes.c_void_p(0)         # (x, y, z) at the start of a vertex
+TEXCOORD_PTR = ctypes.c_void_p(3 * 4)   # (u, v) after the position
 
 # -- Global state ---------------------------------------------------------------
-plane_list = None          # OpenGL display list id
+plane_vbo = None           # Vertex buffer holding QUAD (set in build_plane_vbo)
+tex_id = None              # Texture object (set in init)
 tex_w = tex_h = None
 tex_bytes = None
 last_time = None
@@ -51,6 +68,57 @@ orbit_angle = 0.0          # Orbit angle (radians)
 projection_logged = False  # Print the projection matrix only once
 
 
+# -- Matrix stack ---------------------------------------------------------------
+class MatrixStack:
+    """
+    Python-side stand-in for the fixed-function model-view stack.
+    Matrices are float32 4x4 in mathematical (row-major) order and every
+    operation post-multiplies the top, exactly like its gl* counterpart.
+    """
+
+    def __init__(self):
+        self._stack = [np.identity(4, dtype=np.float32)]
+
+    def load_identity(self):
+        self._stack[-1] = np.identity(4, dtype=np.float32)
+
+    def push(self):
+        self._stack.append(self._stack[-1].copy())
+
+    def pop(self):
+        self._stack.pop()
+
+    def translate(self, x, y, z):
+        m = np.identity(4, dtype=np.float32)
+        m[:3, 3] = (x, y, z)
+        self._stack[-1] = self._stack[-1] @ m
+
+    def scale(self, x, y, z):
+        self._stack[-1] = self._stack[-1] @ np.diag(
+            np.array((x, y, z, 1.0), dtype=np.float32))
+
+    def rotate(self, angle_rad, x, y, z):
+        """Rotate by *angle_rad* around the axis (x, y, z), as glRotatef."""
+        axis = np.array((x, y, z), dtype=np.float32)
+        axis /= np.linalg.norm(axis)
+        c, s = math.cos(angle_rad), math.sin(angle_rad)
+        ax, ay, az = axis
+        m = np.identity(4, dtype=np.float32)
+        m[:3, :3] = (1.0 - c) * np.outer(axis, axis) + np.array([
+            [c, -s * az, s * ay],
+            [s * az, c, -s * ax],
+            [-s * ay, s * ax, c],
+        ], dtype=np.float32)
+        self._stack[-1] = self._stack[-1] @ m
+
+    def load(self):
+        """Upload the top matrix (transposed to OpenGL's column-major)."""
+        glLoadMatrixf(self._stack[-1].T.copy())
+
+
+modelview = MatrixStack()
+
+
 def load_texture():
     """Load the texture image and store raw RGBA bytes."""
     global tex_w, tex_h, tex_bytes
@@ -59,37 +127,45 @@ def load_texture():
     tex_bytes = image.tobytes("raw", "RGBA", 0, -1)
 
 
-def build_plane_list():
+def build_plane_vbo():
     """
-    Compile a display list that draws a textured quad.
-    Using a display list avoids re-issuing all GL commands every frame.
+    Upload the textured quad into a VBO and point the vertex arrays at it.
+    The plane is the only geometry in the scene, so the arrays stay bound
+    and every draw is a single glDrawArrays call.
     """
-    global plane_list
-    plane_list = glGenLists(1)
-    glNewList(plane_list, GL_COMPILE)
+    global plane_vbo
+    plane_vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, plane_vbo)
+    glBufferData(GL_ARRAY_BUFFER, QUAD.nbytes, QUAD, GL_STATIC_DRAW)
 
-    glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-    glTexEnvf(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_DECAL)
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, tex_w, tex_h, 0,
-                 GL_RGBA, GL_UNSIGNED_BYTE, tex_bytes)
-
-    glEnable(GL_TEXTURE_2D)
-    glBegin(GL_QUADS)
-    for (u, v), (x, y, z) in zip(QUAD_TEXCOORDS, QUAD_VERTICES):
-        glTexCoord2f(u, v)
-        glVertex3f(x, y, z)
-    glEnd()
-    glDisable(GL_TEXTURE_2D)
-
-    glEndList()
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+    glVertexPointer(3, GL_FLOAT, STRIDE, VERTEX_PTR)
+    glTexCoordPointer(2, GL_FLOAT, STRIDE, TEXCOORD_PTR)
 
 
 def init():
-    """Background colour, depth test, and perspective projection."""
+    """Background colour, depth test, texture and perspective projection."""
+    global tex_id
     glClearColor(0.0, 0.0, 0.2, 1.0)
     glEnable(GL_DEPTH_TEST)
+    glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+
+    # Upload the texture once into its own texture object
+    tex_id = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, tex_id)
+    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexEnvf(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_DECAL)
+    if bool(glTexStorage2D):
+        # Immutable storage (GL 4.2+): allocate once, then fill level 0
+        glTexStorage2D(GL_TEXTURE_2D, 1, GL_RGBA8, tex_w, tex_h)
+        glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, tex_w, tex_h,
+                        GL_RGBA, GL_UNSIGNED_BYTE, tex_bytes)
+    else:
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, tex_w, tex_h, 0,
+                     GL_RGBA, GL_UNSIGNED_BYTE, tex_bytes)
+
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
     aspect = WINDOW_W / float(WINDOW_H)
@@ -112,36 +188,54 @@ def reshape(w, h):
     # An affine matrix has last row = [0, 0, 0, 1].
     # A perspective matrix has last row ~ [0, 0, -1, 0] -> not affine.
     if not projection_logged:
-        proj = glGetDoublev(GL_PROJECTION_MATRIX)
+        proj = perspective_matrix(FOV_Y, w / float(h), NEAR_PLANE, FAR_PLANE)
         print("Projection matrix (perspective -- NOT affine):")
-        for row in range(4):
-            print("  ", [round(proj[row][col], 6) for col in range(4)])
+        for row in proj:
+            print("  ", [round(value, 6) for value in row])
         print("Last row != [0, 0, 0, 1] -> confirms non-affine projection.\n")
         projection_logged = True
 
 
+def perspective_matrix(fov_y_deg, aspect, near, far):
+    """
+    Return the 4x4 matrix gluPerspective builds, as a list of rows
+    (mathematical row-major order; OpenGL stores it column-major).
+    """
+    f = 1.0 / math.tan(math.radians(fov_y_deg) / 2.0)
+    depth_scale = (far + near) / (near - far)
+    depth_offset = 2.0 * far * near / (near - far)
+    return [
+        [f / aspect, 0.0, 0.0, 0.0],
+        [0.0, f, 0.0, 0.0],
+        [0.0, 0.0, depth_scale, depth_offset],
+        [0.0, 0.0, -1.0, 0.0],
+    ]
+
+
 def update_angles():
     """Advance both angles using real elapsed time (radians)."""
     global last_time, self_angle, orbit_angle
-    current = glutGet(GLUT_ELAPSED_TIME) / 1000.0
+    current = time.perf_counter()
     if last_time is None:
         last_time = current
     dt = current - last_time
     last_time = current
-    self_angle = (self_angle + SELF_SPIN_SPEED * dt) % (2.0 * math.pi)
-    orbit_angle = (orbit_angle + ORBIT_SPEED * dt) % (2.0 * math.pi)
+    self_angle = (self_angle + SELF_SPIN_SPEED * dt) % TWO_PI
+    orbit_angle = (orbit_angle + ORBIT_SPEED * dt) % TWO_PI
 
 
 def draw_plane(position, spin_axis, spin_angle_rad, scale=5.0):
     """
     Helper: translate to *position*, scale, rotate by *spin_angle_rad*
-    around *spin_axis*, then draw the compiled plane display list.
+    around *spin_axis*, then draw the plane from its VBO.
     """
-    glTranslatef(*position)
-    glScalef(scale, scale, 1.0)
-    # Convert radians -> degrees for glRotatef
-    glRotatef(math.degrees(spin_angle_rad), *spin_axis)
-    glCallList(plane_list)
+    modelview.translate(*position)
+    modelview.scale(scale, scale, 1.0)
+    modelview.rotate(spin_angle_rad, *spin_axis)
+    modelview.load()
+    glEnable(GL_TEXTURE_2D)
+    glDrawArrays(GL_QUADS, 0, 4)
+    glDisable(GL_TEXTURE_2D)
 
 
 def display():
@@ -149,47 +243,48 @@ def display():
     Display callback.
     - Plane A: translated to the left, spins in place.
     - Plane B: orbits around the Y axis, then spins on its own axis.
-    glPushMatrix / glPopMatrix ensure each plane's transformations do not
-    leak into the other.
+    push / pop on the matrix stack ensure each plane's transformations do
+    not leak into the other.
     """
     update_angles()
 
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
     glMatrixMode(GL_MODELVIEW)
-    glLoadIdentity()
+    modelview.load_identity()
 
     # Base camera transform: pull everything back along -Z
-    glTranslatef(0.0, 0.0, -150.0)
+    modelview.translate(0.0, 0.0, -150.0)
 
     # -- Plane A: spins in place -------------------------------------------
-    glPushMatrix()
+    modelview.push()
     draw_plane(
         position=(-10.0, 0.0, 0.0),
         spin_axis=(1.0, 1.0, 1.0),
         spin_angle_rad=self_angle,
     )
-    glPopMatrix()
+    modelview.pop()
 
     # -- Plane B: orbits around Plane A and also spins ---------------------
-    glPushMatrix()
+    modelview.push()
     # First, rotate the entire coordinate frame around Y -> creates the orbit
-    glRotatef(math.degrees(orbit_angle), 0.0, 1.0, 0.0)
+    modelview.rotate(orbit_angle, 0.0, 1.0, 0.0)
     # Then translate outward to the orbit radius
-    glTranslatef(ORBIT_RADIUS, 0.0, 0.0)
+    modelview.translate(ORBIT_RADIUS, 0.0, 0.0)
     # Finally, draw the plane with its own spin
     draw_plane(
         position=(0.0, 0.0, 0.0),
         spin_axis=(1.0, -1.0, 1.0),
         spin_angle_rad=self_angle,
     )
-    glPopMatrix()
+    modelview.pop()
 
     glutSwapBuffers()
 
 
-def idle():
-    """Request continuous redisplay for animation."""
+def timer(_value):
+    """Timer callback: requests a redisplay and re-arms itself (~60 Hz)."""
     glutPostRedisplay()
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
 
 
 # -- Main entry point ----------------------------------------------------------
@@ -201,8 +296,8 @@ if __name__ == "__main__":
     glutInitWindowSize(WINDOW_W, WINDOW_H)
     glutCreateWindow(b"Textured Planes - Matrices & Perspective")
     init()
-    build_plane_list()
+    build_plane_vbo()
     glutDisplayFunc(display)
     glutReshapeFunc(reshape)
-    glutIdleFunc(idle)
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
     glutMainLoop()
@@ -7,19 +7,24 @@ in different planes:
   - Cube B orbits in the XZ plane (rotation around the Y axis).
 
 Key concepts demonstrated:
-  - 3D textured cube built with vertex arrays and a display list.
+  - 3D textured cube stored as interleaved float32 data in a Vertex Buffer
+    Object (VBO) and drawn with a single glDrawArrays call.
   - Perspective projection with gluPerspective.
-  - Hierarchical transforms with glPushMatrix / glPopMatrix.
+  - Hierarchical transforms on a small NumPy matrix stack (push / pop);
+    each cube uploads its model-view matrix with one glLoadMatrixf.
   - Orbital positions computed with sin/cos in radians.
-  - All internal angles in radians; converted to degrees only for glRotatef.
+  - All angles in radians; the rotation matrices are built from cos/sin.
   - Depth testing for correct face ordering.
 """
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
+import ctypes
 import sys
 import math
+import time
+import numpy as np
 from PIL import Image
 
 # -- Window / projection -------------------------------------------------------
@@ -36,34 +41,45 @@ ORBIT_SPEED_XY = 2.0 * math.pi / 14.4    # ~ 25deg/s  (XY-plane orbit)
 ORBIT_SPEED_XZ = 2.0 * math.pi / 24.0    # ~ 15deg/s  (XZ-plane orbit)
 ORBIT_RADIUS = 45.0                       # Distance from the centre of the scene
 CUBE_SCALE = 18.0                         # Uniform scale applied to each cube
+TWO_PI = 2.0 * math.pi                    # Full turn (radians)
+FRAME_INTERVAL_MS = 16                    # Animation timer period (~60 Hz)
 
 # -- Texture --------------------------------------------------------------------
 TEXTURE_PATH = "img/box.jpg"
 
 # -- Cube geometry --------------------------------------------------------------
 # 8 unique vertices of a unit cube [0, 1]^3
-VERTEX_CUBE = [
+VERTEX_CUBE = np.array([
     (0.0, 0.0, 0.0), (1.0, 0.0, 0.0),
     (0.0, 1.0, 0.0), (1.0, 1.0, 0.0),
     (0.0, 0.0, 1.0), (1.0, 0.0, 1.0),
     (0.0, 1.0, 1.0), (1.0, 1.0, 1.0),
-]
+], dtype=np.float32)
 
 # Face indices (6 faces x 4 vertices each, drawn as GL_QUADS)
-INDEX_CUBE = [
+INDEX_CUBE = np.array([
     0, 1, 3, 2,  # face z = 0
     4, 5, 7, 6,  # face z = 1
     0, 1, 5, 4,  # face y = 0
     2, 3, 7, 6,  # face y = 1
     1, 3, 7, 5,  # face x = 1
     0, 2, 6, 4,  # face x = 0
-]
+])
 
 # Texture coordinates: the same [0,1]^2 quad is tiled on every face
-SQUARE_TEX = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)] * 6
+SQUARE_TEX = np.tile(np.array(
+    [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)], dtype=np.float32), (6, 1))
+
+# Interleaved layout: 5 floats (x, y, z, u, v) for each of the 24 face
+# vertices, centred at the origin (unit cube shifted by -0.5)
+CUBE = np.hstack((VERTEX_CUBE[INDEX_CUBE] - 0.5, SQUARE_TEX))
+NUM_CUBE_VERTICES = len(CUBE)
+STRIDE = 5 * 4                          # Bytes between consecutive vertices
+VERTEX_PTR = ctypes.c_void_p(0)         # (x, y, z) at the start of a vertex
+TEXCOORD_PTR = ctypes.c_void_p(3 * 4)   # (u, v) after the position
 
 # -- Global state ---------------------------------------------------------------
-cube_list = None                # Display list id
+cube_vbo = None                 # Vertex buffer holding CUBE
 tex_w = tex_h = None
 tex_bytes = None
 last_time = None
@@ -72,6 +88,57 @@ orbit_angle_xy = 0.0            # Orbit in XY plane (radians)
 orbit_angle_xz = 0.0            # Orbit in XZ plane (radians)
 
 
+# -- Matrix stack ---------------------------------------------------------------
+class MatrixStack:
+    """
+    Python-side stand-in for the fixed-function model-view stack.
+    Matrices are float32 4x4 in mathematical (row-major) order and every
+    operation post-multiplies the top, exactly like its gl* counterpart.
+    """
+
+    def __init__(self):
+        self._stack = [np.identity(4, dtype=np.float32)]
+
+    def load_identity(self):
+        self._stack[-1] = np.identity(4, dtype=np.float32)
+
+    def push(self):
+        self._stack.append(self._stack[-1].copy())
+
+    def pop(self):
+        self._stack.pop()
+
+    def translate(self, x, y, z):
+        m = np.identity(4, dtype=np.float32)
+        m[:3, 3] = (x, y, z)
+        self._stack[-1] = self._stack[-1] @ m
+
+    def scale(self, x, y, z):
+        self._stack[-1] = self._stack[-1] @ np.diag(
+            np.array((x, y, z, 1.0), dtype=np.float32))
+
+    def rotate(self, angle_rad, x, y, z):
+        """Rotate by *angle_rad* around the axis (x, y, z), as glRotatef."""
+        axis = np.array((x, y, z), dtype=np.float32)
+        axis /= np.linalg.norm(axis)
+        c, s = math.cos(angle_rad), math.sin(angle_rad)
+        ax, ay, az = axis
+        m = np.identity(4, dtype=np.float32)
+        m[:3, :3] = (1.0 - c) * np.outer(axis, axis) + np.array([
+            [c, -s * az, s * ay],
+            [s * az, c, -s * ax],
+            [-s * ay, s * ax, c],
+        ], dtype=np.float32)
+        self._stack[-1] = self._stack[-1] @ m
+
+    def load(self):
+        """Upload the top matrix (transposed to OpenGL's column-major)."""
+        glLoadMatrixf(self._stack[-1].T.copy())
+
+
+modelview = MatrixStack()
+
+
 # -- Texture loading -----------------------------------------------------------
 def load_texture():
     """Read the image file and store raw RGBA pixel data."""
@@ -81,37 +148,22 @@ def load_texture():
     tex_bytes = image.tobytes("raw", "RGBA", 0, -1)
 
 
-# -- Display list ---------------------------------------------------------------
-def build_cube_list():
+# -- Vertex buffer --------------------------------------------------------------
+def build_cube_vbo():
     """
-    Compile a display list for the unit cube.
-    The cube is centred at the origin via a translate(-0.5) inside the list,
-    so callers only need to scale and position it.
+    Upload the centred unit cube into a VBO and point the vertex arrays at it.
+    The cube is the only geometry in the scene, so the arrays stay bound and
+    callers only need to scale and position it before glDrawArrays.
     """
-    global cube_list
-    # Expand indexed vertices into a flat list for glVertexPointer
-    verts = [VERTEX_CUBE[i] for i in INDEX_CUBE]
-
-    cube_list = glGenLists(1)
-    glNewList(cube_list, GL_COMPILE)
+    global cube_vbo
+    cube_vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, cube_vbo)
+    glBufferData(GL_ARRAY_BUFFER, CUBE.nbytes, CUBE, GL_STATIC_DRAW)
 
-    glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-
-    # Centre the cube at the origin (vertices go from 0->1, shift by -0.5)
-    glPushMatrix()
-    glTranslatef(-0.5, -0.5, -0.5)
-
-    # Use vertex arrays for efficient rendering
     glEnableClientState(GL_VERTEX_ARRAY)
     glEnableClientState(GL_TEXTURE_COORD_ARRAY)
-    glVertexPointer(3, GL_FLOAT, 0, verts)
-    glTexCoordPointer(2, GL_FLOAT, 0, SQUARE_TEX)
-    glDrawArrays(GL_QUADS, 0, len(verts))
-    glDisableClientState(GL_TEXTURE_COORD_ARRAY)
-    glDisableClientState(GL_VERTEX_ARRAY)
-
-    glPopMatrix()
-    glEndList()
+    glVertexPointer(3, GL_FLOAT, STRIDE, VERTEX_PTR)
+    glTexCoordPointer(2, GL_FLOAT, STRIDE, TEXCOORD_PTR)
 
 
 # -- Init -----------------------------------------------------------------------
@@ -122,13 +174,20 @@ def init():
     glClearDepth(1.0)
     glDepthFunc(GL_LESS)
     glDisable(GL_CULL_FACE)                    # Show both faces of each quad
+    glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
     glHint(GL_PERSPECTIVE_CORRECTION_HINT, GL_NICEST)
 
     # Texture setup
     glBindTexture(GL_TEXTURE_2D, glGenTextures(1))
     glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
-    glTexImage2D(GL_TEXTURE_2D, 0, 3, tex_w, tex_h, 0,
-                 GL_RGBA, GL_UNSIGNED_BYTE, tex_bytes)
+    if bool(glTexStorage2D):
+        # Immutable storage (GL 4.2+): allocate once, then fill level 0
+        glTexStorage2D(GL_TEXTURE_2D, 1, GL_RGBA8, tex_w, tex_h)
+        glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, tex_w, tex_h,
+                        GL_RGBA, GL_UNSIGNED_BYTE, tex_bytes)
+    else:
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, tex_w, tex_h, 0,
+                     GL_RGBA, GL_UNSIGNED_BYTE, tex_bytes)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
@@ -159,27 +218,28 @@ def reshape(w, h):
 def update_angles():
     """Advance all angles using real elapsed time (radians)."""
     global last_time, self_angle, orbit_angle_xy, orbit_angle_xz
-    current = glutGet(GLUT_ELAPSED_TIME) / 1000.0
+    current = time.perf_counter()
     if last_time is None:
         last_time = current
     dt = current - last_time
     last_time = current
-    self_angle = (self_angle + SELF_SPIN_SPEED * dt) % (2.0 * math.pi)
-    orbit_angle_xy = (orbit_angle_xy + ORBIT_SPEED_XY * dt) % (2.0 * math.pi)
-    orbit_angle_xz = (orbit_angle_xz + ORBIT_SPEED_XZ * dt) % (2.0 * math.pi)
+    self_angle = (self_angle + SELF_SPIN_SPEED * dt) % TWO_PI
+    orbit_angle_xy = (orbit_angle_xy + ORBIT_SPEED_XY * dt) % TWO_PI
+    orbit_angle_xz = (orbit_angle_xz + ORBIT_SPEED_XZ * dt) % TWO_PI
 
 
 def draw_cube(position, spin_axis=(1.0, 2.0, 0.0), spin_angle_rad=0.0):
     """
     Draw a scaled, rotated cube at *position*.
-    The spin angle is in radians and converted to degrees for glRotatef.
+    The spin angle is in radians.
     """
-    glPushMatrix()
-    glTranslatef(*position)
-    glScalef(CUBE_SCALE, CUBE_SCALE, CUBE_SCALE)
-    glRotatef(math.degrees(spin_angle_rad), *spin_axis)
-    glCallList(cube_list)
-    glPopMatrix()
+    modelview.push()
+    modelview.translate(*position)
+    modelview.scale(CUBE_SCALE, CUBE_SCALE, CUBE_SCALE)
+    modelview.rotate(spin_angle_rad, *spin_axis)
+    modelview.load()
+    glDrawArrays(GL_QUADS, 0, NUM_CUBE_VERTICES)
+    modelview.pop()
 
 
 # -- Display --------------------------------------------------------------------
@@ -195,10 +255,10 @@ def display():
 
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
     glMatrixMode(GL_MODELVIEW)
-    glLoadIdentity()
+    modelview.load_identity()
 
     # Pull the camera back so both orbits are visible
-    glTranslatef(0.0, 0.0, CAMERA_Z)
+    modelview.translate(0.0, 0.0, CAMERA_Z)
 
     # -- Cube A: orbits in the XY plane (circle around Z) -----------------
     x_a = ORBIT_RADIUS * math.cos(orbit_angle_xy)  # radians -> cos/sin
@@ -214,9 +274,10 @@ def display():
     glutSwapBuffers()
 
 
-def idle():
-    """Request continuous redisplay for animation."""
+def timer(_value):
+    """Timer callback: requests a redisplay and re-arms itself (~60 Hz)."""
     glutPostRedisplay()
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
 
 
 # -- Main entry point ----------------------------------------------------------
@@ -228,8 +289,8 @@ if __name__ == "__main__":
     glutInitWindowSize(WINDOW_W, WINDOW_H)
     glutCreateWindow(b"Dual Orbiting Textured Cubes")
     init()
-    build_cube_list()
+    build_cube_vbo()
     glutDisplayFunc(display)
-    glutIdleFunc(idle)
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, 0)
     glutReshapeFunc(reshape)
     glutMainLoop()
@@ -7,14 +7,18 @@ rendered in real-time with OpenGL.
 Features
 --------
   * All 8 planets (Mercury through Neptune) with correct relative ordering.
-  * Earth has three layers: day-side texture, night-side city-lights texture
-    (via additive blending), and a semi-transparent cloud layer that
-    rotates at a different speed to the surface.
+  * Earth combines three maps: day-side texture, night-side city lights,
+    and a semi-transparent cloud layer that rotates at a different speed
+    to the surface, composited by one shader in a single draw (without
+    shaders, each layer is its own blended pass with additive night
+    lights).
   * Saturn has a textured ring (alpha-blended from saturn_ring.png) that
     rotates at its own mean Keplerian angular velocity in the equatorial
     plane, independent of the planet's surface spin.
-  * Milky Way panorama mapped onto a large inverted skysphere as a
-    photographic backdrop behind all scene geometry.
+  * Milky Way panorama as a photographic backdrop behind all scene
+    geometry, drawn as one full-screen quad on the far plane whose shader
+    ray-casts the sky sphere (without shaders, the shared unit sphere is
+    scaled up and drawn with depth testing switched off).
   * A dense starfield of ~2 500 stars that twinkle smoothly (random phase +
     sinusoidal brightness oscillation) layered on top of the backdrop.
   * Point-light source at the Sun position so day/night shading is physical.
@@ -30,7 +34,8 @@ Features
 Conventions
 -----------
   * All internal angles are stored in **radians**.
-  * Degrees appear ONLY at the OpenGL API boundary (glRotatef, gluPerspective).
+  * Degrees appear ONLY at the OpenGL API boundary (gluPerspective); every
+    rotation is built from radians as a NumPy matrix (glMultMatrixf).
   * All text in this file is 100% ASCII.
 
 Controls
@@ -49,12 +54,25 @@ Controls
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
+from OpenGL.GL import shaders
+from OpenGL.GL.EXT.texture_compression_s3tc import (
+    GL_COMPRESSED_RGB_S3TC_DXT1_EXT, GL_COMPRESSED_RGBA_S3TC_DXT5_EXT,
+    glInitTextureCompressionS3TcEXT,
+)
+from OpenGL.GL.ARB.half_float_vertex import glInitHalfFloatVertexARB
+from OpenGL.GL.EXT.texture_filter_anisotropic import (
+    GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT, GL_TEXTURE_MAX_ANISOTROPY_EXT,
+    glInitTextureFilterAnisotropicEXT,
+)
 import ctypes
+import hashlib
 import math
+from concurrent.futures import ThreadPoolExecutor
 import os
-import random
 import sys
-from PIL import Image
+import time
+import numpy as np
+from PIL import Image, ImageFont, ImageDraw
 
 # PyOpenGL exposes GLUT bitmap fonts via dynamic attribute lookup, which
 # confuses static analysers (Pylance).  Resolve the pointer once here.
@@ -89,6 +107,8 @@ WINDOW_W, WINDOW_H = +1400, +850
 NEAR_PLANE  = +1.0
 FAR_PLANE   = +5000.0
 FOV_Y       = +45.0
+FRAME_INTERVAL_MS = +16   # Animation timer period (~60 Hz)
+MSAA_SAMPLES      = +4    # Multisample anti-aliasing samples per pixel
 
 # ---------------------------------------------------------------------------
 #  Texture paths (resolved via _res for source and frozen .exe)
@@ -109,6 +129,17 @@ TEX_URANUS       = _res("img/uranus.jpg")
 TEX_NEPTUNE      = _res("img/neptune.jpg")
 TEX_MILKY_WAY    = _res("img/milky_way.jpg")
 
+# Decoded pixel arrays are cached here (as .npy) so later runs skip PIL
+TEXTURE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "opengl-seminar")
+# Bump whenever decode_texture() changes its output (row flip, alpha
+# handling, ...) so stale cache entries are never served
+TEXTURE_CACHE_VERSION = +1
+
+# Upper bound on anisotropic filtering (clamped to what the driver allows)
+MAX_ANISOTROPY = +8.0
+
 # ---------------------------------------------------------------------------
 #  Sphere detail (slices / stacks)
 # ---------------------------------------------------------------------------
@@ -146,6 +177,9 @@ D_SATURN  = +175.0
 D_URANUS  = +215.0
 D_NEPTUNE = +250.0
 
+# One full turn; every animated angle is wrapped to [0, TWO_PI)
+TWO_PI = +2.0 * math.pi
+
 # ---------------------------------------------------------------------------
 #  Angular speeds -- orbital (radians / second)
 #  Faster for inner planets, slower for outer (inspired by Kepler).
@@ -222,6 +256,7 @@ STAR_TWINKLE_SPEED_MIN = +0.5
 STAR_TWINKLE_SPEED_MAX = +3.0
 STAR_MIN_BRIGHTNESS    = +0.25
 STAR_MAX_BRIGHTNESS    = +1.0
+STAR_SEED              = +42     # Fixed seed -> same sky every run
 
 # ---------------------------------------------------------------------------
 #  Camera defaults
@@ -231,6 +266,7 @@ CAM_DEFAULT_YAW   = +0.0
 CAM_DEFAULT_PITCH = +0.35
 CAM_YAW_SPEED     = +2.0
 CAM_PITCH_SPEED   = +1.5
+CAM_PITCH_LIMIT   = math.pi / +2.0 - +0.05   # stay just short of the poles
 CAM_ZOOM_SPEED    = +80.0
 CAM_MIN_DIST      = -50.0
 CAM_MAX_DIST      = -800.0
@@ -244,18 +280,29 @@ ORBIT_ALPHA    = +0.15
 # ---------------------------------------------------------------------------
 #  Runtime state -- angles (radians)
 # ---------------------------------------------------------------------------
-angle_sun_spin     = +0.0
-angle_mercury_orb  = +0.0;  angle_mercury_spin = +0.0
-angle_venus_orb    = +0.0;  angle_venus_spin   = +0.0
-angle_earth_orb    = +0.0;  angle_earth_spin   = +0.0
-angle_cloud_spin   = +0.0
-angle_moon_orb     = +0.0
-angle_mars_orb     = +0.0;  angle_mars_spin    = +0.0
-angle_jupiter_orb  = +0.0;  angle_jupiter_spin = +0.0
-angle_saturn_orb   = +0.0;  angle_saturn_spin  = +0.0
-angle_saturn_ring  = +0.0
-angle_uranus_orb   = +0.0;  angle_uranus_spin  = +0.0
-angle_neptune_orb  = +0.0;  angle_neptune_spin = +0.0
+# Every animated angle lives in one array so update_angles() can advance
+# them all with a single wrap-add.  The orbital slots come first, in the
+# same order as the ORB_* orbit-frame indices.
+I_MERCURY_ORB, I_VENUS_ORB, I_EARTH_ORB, I_MARS_ORB = +0, +1, +2, +3
+I_JUPITER_ORB, I_SATURN_ORB, I_URANUS_ORB         = +4, +5, +6
+I_NEPTUNE_ORB, I_MOON_ORB                         = +7, +8
+I_SUN_SPIN, I_MERCURY_SPIN, I_VENUS_SPIN          = +9, +10, +11
+I_EARTH_SPIN, I_CLOUD_SPIN, I_MARS_SPIN           = +12, +13, +14
+I_JUPITER_SPIN, I_SATURN_SPIN, I_SATURN_RING      = +15, +16, +17
+I_URANUS_SPIN, I_NEPTUNE_SPIN                     = +18, +19
+NUM_ANGLES = +20
+
+# Angular speed of each slot above (radians / second)
+OMEGAS = np.array([
+    W_MERCURY_ORBIT, W_VENUS_ORBIT, W_EARTH_ORBIT, W_MARS_ORBIT,
+    W_JUPITER_ORBIT, W_SATURN_ORBIT, W_URANUS_ORBIT,
+    W_NEPTUNE_ORBIT, W_MOON_ORBIT,
+    W_SUN_SPIN, W_MERCURY_SPIN, W_VENUS_SPIN,
+    W_EARTH_SPIN, W_CLOUD_SPIN, W_MARS_SPIN,
+    W_JUPITER_SPIN, W_SATURN_SPIN, W_SATURN_RING_SPIN,
+    W_URANUS_SPIN, W_NEPTUNE_SPIN,
+])
+ANGLES = np.zeros(NUM_ANGLES)
 
 last_time = None
 
@@ -270,40 +317,190 @@ keys_held = set()
 # Pause state
 paused = False
 
+# Redraw scheduling: the timer stops re-arming while the window is hidden
+window_visible = True
+timer_armed    = False
+
 # ---------------------------------------------------------------------------
 #  Starfield data (filled in create_starfield)
 # ---------------------------------------------------------------------------
-star_positions  = []   # list of (x, y, z)
-star_phases     = []   # random phase offset per star (radians)
-star_speeds     = []   # twinkle frequency per star (radians/s)
-star_base_sizes = []   # base GL point size per star
+# Stars are sorted by size bucket so each bucket is one contiguous range.
+star_positions  = None   # (NUM_STARS, 3) float32 -- (x, y, z)
+star_phases     = None   # random phase offset per star (radians)
+star_speeds     = None   # twinkle frequency per star (radians/s)
+star_base_sizes = None   # base GL point size per star
+star_tints      = None   # (NUM_STARS, 3) warm/cool colour tint per star
+star_colors     = None   # (NUM_STARS, 3) float32 scratch, refilled per frame
+star_buckets    = []     # (first, count, point_size) per size bucket
+star_vbo        = None   # static positions
+star_color_vbo  = None   # static tints (shader) or streamed colours (fallback)
+star_attr_vbo   = None   # static (point_size, speed, phase) (shader path only)
+star_program    = None   # twinkle shader, or None (per-bucket fallback)
+star_attr_loc   = -1     # location of the *star_attr* attribute
+star_time_loc   = -1     # location of the *time* uniform
+
+# Orbit rings (filled in build_orbit_rings_vbo)
+orbit_vbo    = None   # static (r, g, b, a, x, y, z) for every ring
+orbit_firsts = None   # first vertex of each ring
+orbit_counts = None   # vertex count of each ring
 
 # ---------------------------------------------------------------------------
 #  GL resource handles (populated after context creation)
 # ---------------------------------------------------------------------------
-dl_sun         = None
-dl_mercury     = None
-dl_venus       = None
-dl_earth_day   = None
-dl_earth_night = None
-dl_earth_cloud = None
-dl_moon        = None
-dl_mars        = None
-dl_jupiter     = None
-dl_saturn      = None
-dl_saturn_ring = None
-dl_uranus      = None
-dl_neptune     = None
-dl_glow        = None
-dl_milky_way   = None
+# Shared unit-sphere mesh (see build_unit_sphere_vbo)
+sphere_vbo         = None
+sphere_ibo         = None
+sphere_index_count = +0
+sphere_index_type  = GL_UNSIGNED_INT
+sphere_attrib_type = GL_FLOAT   # GL_HALF_FLOAT when the driver supports it
+sphere_stride      = +24        # bytes per (u, v, x, y, z, pad) vertex
+sphere_xyz_offset  = +8         # byte offset of x within each vertex
+sphere_vao         = None   # Vertex array capturing the state above, if supported
+
+# Unit quad shared by the sky and the corona (see build_quad_vbo)
+quad_vbo = None
+
+# Ray-cast corona billboard (see build_glow); None -> one draw per shell
+glow_program = None
+
+# Milky Way at the far plane (see build_sky_program); None -> depth test off
+sky_program = None
+
+# Fused Earth pass (see build_earth_program); None -> three sphere passes
+earth_program          = None
+earth_cloud_offset_loc = -1
+
+# Instanced planets (see build_planet_batch); None -> draw_planet() each
+planet_program      = None
+planet_vao          = None
+planet_tex_array    = None
+planet_instance_vbo = None
+
+# HUD glyph atlas (see build_hud_font); None -> glutBitmapCharacter
+hud_font_tex = None
+hud_glyphs   = None    # (95, 5) rows of (u0, v0, u1, v1, advance), ASCII 32..126
+hud_metrics  = None    # (cell width, ascent, descent) in pixels
+_hud_cache   = {}      # text -> (vbo, vertex count) of its glyph quads
+
+# Textured spheres: (texture id, radius) pairs drawn with draw_sphere()
+sph_sun         = None
+sph_mercury     = None
+sph_venus       = None
+sph_earth_day   = None
+sph_earth_night = None
+sph_earth_cloud = None
+sph_moon        = None
+sph_mars        = None
+sph_jupiter     = None
+sph_saturn      = None
+sph_uranus      = None
+sph_neptune     = None
+sph_milky_way   = None
+
+# Saturn's ring: (texture id, vbo, vertex count) drawn with draw_ring()
+ring_saturn = None
+
+# Driver capabilities (queried in init_gl)
+s3tc_supported = False
+anisotropy     = +1.0   # 1.0 -> anisotropic filtering unavailable
 
 
 # ===================================================================
 #  Texture loading
 # ===================================================================
 
-def load_texture(filepath, has_alpha=False, alpha_from_luminance=False):
-    """Load an image from *filepath* and upload it as a GL_TEXTURE_2D.
+# Decodes started by prefetch_textures(), keyed by
+# (filepath, has_alpha, alpha_from_luminance); consumed by load_texture()
+_texture_futures = {}
+
+
+def decode_texture(filepath, has_alpha=False, alpha_from_luminance=False):
+    """Decode *filepath* into bottom-up raw pixel data.
+
+    The result is cached in TEXTURE_CACHE_DIR, keyed by the file's path,
+    size and modification time plus the decode mode and
+    TEXTURE_CACHE_VERSION, so later runs memory-map the pixels instead of
+    running PIL -- without reading the image file at all.
+    Makes no GL calls, so it is safe to run on a worker thread (PIL
+    releases the GIL while decoding).  Returns (w, h, raw, gl_fmt,
+    internal_fmt); see load_texture() for the parameters.
+    """
+    if alpha_from_luminance:
+        mode = "RGBA_L"
+    elif has_alpha:
+        mode = "RGBA"
+    else:
+        mode = "RGB"
+    gl_fmt, internal_fmt = ((GL_RGB, GL_RGB8) if mode == "RGB"
+                            else (GL_RGBA, GL_RGBA8))
+    st = os.stat(filepath)
+    key = (f"v{TEXTURE_CACHE_VERSION}|{os.path.abspath(filepath)}|"
+           f"{st.st_size}|{st.st_mtime_ns}|{mode}")
+    digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+    cache_path = os.path.join(TEXTURE_CACHE_DIR, f"{digest}_{mode}.npy")
+
+    try:
+        raw = np.load(cache_path, mmap_mode="r")
+    except (OSError, ValueError):
+        raw = None
+    if raw is not None:
+        h, w = raw.shape[:2]
+        return w, h, raw, gl_fmt, internal_fmt
+
+    img = Image.open(filepath)
+
+    if alpha_from_luminance:
+        # Build RGBA where A = luminance of the pixel
+        img_rgb = img.convert("RGB")
+        lum = img.convert("L")
+        img = Image.merge("RGBA", (*img_rgb.split(), lum))
+    elif has_alpha:
+        img = img.convert("RGBA")
+    else:
+        # Opaque image: upload tightly packed RGB (3 bytes per pixel, no
+        # padding pass); GL_UNPACK_ALIGNMENT = 1 handles odd row sizes
+        img = img.convert("RGB")
+
+    # Rows flipped bottom-up for OpenGL; .copy() keeps the array C-contiguous
+    raw = np.asarray(img)[::-1].copy()
+    try:
+        # Write to a temporary name first so a reader never sees half a file
+        os.makedirs(TEXTURE_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, raw)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass    # Read-only or full disk: just decode again next run
+
+    w, h = img.size
+    return w, h, raw, gl_fmt, internal_fmt
+
+
+def prefetch_textures(pool, requests):
+    """Start decoding every (filepath, has_alpha, alpha_from_luminance)
+    in *requests* on the executor *pool*.
+
+    The GL context belongs to the main thread, so only decoding runs in
+    the background; load_texture() later waits for each result and does
+    the upload, overlapping it with the decodes still in flight.
+    """
+    for key in requests:
+        _texture_futures[key] = pool.submit(decode_texture, *key)
+
+
+def _take_decoded(key):
+    """Return decode_texture(*key), from its prefetch future if one exists."""
+    future = _texture_futures.pop(key, None)
+    if future is not None:
+        return future.result()
+    return decode_texture(*key)
+
+
+def load_texture(filepath, has_alpha=False, alpha_from_luminance=False,
+                 compressed=True):
+    """Load an image from *filepath* and upload it as a mipmapped
+    GL_TEXTURE_2D.
 
     Parameters
     ----------
@@ -315,222 +512,618 @@ def load_texture(filepath, has_alpha=False, alpha_from_luminance=False):
         If True the alpha channel is derived from the pixel brightness.
         White pixels become opaque, black pixels become transparent.
         Ideal for cloud maps stored as RGB JPEGs.
+    compressed : bool
+        If True (and the driver supports S3TC) opaque images are stored
+        as DXT1 -- 1/8 of the RGBA8 footprint -- and images with alpha as
+        DXT5 -- 1/4 of it -- compressed by the driver at upload time.
 
     Returns
     -------
     int
         The OpenGL texture name (id).
     """
-    img = Image.open(filepath)
+    w, h, raw, gl_fmt, internal_fmt = _take_decoded(
+        (filepath, has_alpha, alpha_from_luminance))
 
-    if alpha_from_luminance:
-        # Build RGBA where A = luminance of the pixel
-        img_rgb = img.convert("RGB")
-        lum = img.convert("L")
-        img = Image.merge("RGBA", (*img_rgb.split(), lum))
-        raw = img.tobytes("raw", "RGBA", +0, -1)
-        gl_fmt = GL_RGBA
-    elif has_alpha:
-        img = img.convert("RGBA")
-        raw = img.tobytes("raw", "RGBA", +0, -1)
-        gl_fmt = GL_RGBA
-    else:
-        # Pad to RGBX (4 bytes per pixel) for alignment
-        img = img.convert("RGBX")
-        raw = img.tobytes("raw", "RGBX", +0, -1)
-        gl_fmt = GL_RGBA
+    if compressed and s3tc_supported:
+        internal_fmt = (GL_COMPRESSED_RGB_S3TC_DXT1_EXT
+                        if internal_fmt == GL_RGB8
+                        else GL_COMPRESSED_RGBA_S3TC_DXT5_EXT)
 
-    w, h = img.size
+    levels = int(math.log2(max(w, h))) + +1   # full mipmap chain
     tex_id = glGenTextures(+1)
     glPixelStorei(GL_UNPACK_ALIGNMENT, +1)
     glBindTexture(GL_TEXTURE_2D, tex_id)
 
-    glTexImage2D(GL_TEXTURE_2D, +0, GL_RGBA, w, h, +0,
-                 gl_fmt, GL_UNSIGNED_BYTE, raw)
+    if bool(glTexStorage2D):
+        # Immutable storage (GL 4.2+): allocate once, then fill level 0
+        glTexStorage2D(GL_TEXTURE_2D, levels, internal_fmt, w, h)
+        glTexSubImage2D(GL_TEXTURE_2D, +0, +0, +0, w, h,
+                        gl_fmt, GL_UNSIGNED_BYTE, raw)
+    else:
+        glTexImage2D(GL_TEXTURE_2D, +0, internal_fmt, w, h, +0,
+                     gl_fmt, GL_UNSIGNED_BYTE, raw)
+
+    # Smaller levels for distant bodies: less aliasing, better cache hits
+    glGenerateMipmap(GL_TEXTURE_2D)
 
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER,
+                    GL_LINEAR_MIPMAP_LINEAR)
+    # Keeps sphere poles and the edge-on ring sharp at grazing angles
+    if anisotropy > +1.0:
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAX_ANISOTROPY_EXT,
+                        anisotropy)
 
     return tex_id
 
 
 # ===================================================================
-#  Sphere display-list builder
+#  Sphere mesh (one VBO shared by every textured body)
 # ===================================================================
 
-def build_sphere_list(filepath, radius, has_alpha=False,
-                      alpha_from_luminance=False):
-    """Create a display list that draws a textured sphere.
-
-    The texture is loaded and bound inside the list so calling
-    glCallList is sufficient to render the sphere.
+def build_unit_sphere_vbo(slices, stacks):
+    """Tessellate a unit sphere once with NumPy and upload it to the GPU.
+
+    The layout matches gluSphere with texturing enabled (u around the
+    equator, v from the north pole down) with the usual -90 degree X
+    rotation already baked in, so the poles lie on the Y axis and the
+    equatorial texture bands wrap correctly.  Vertices are interleaved as
+    (u, v, x, y, z, pad); on a unit sphere the normal equals the position,
+    so the normal and vertex arrays read the same xyz (see
+    _sphere_pointers).  Attributes are half floats when the driver
+    accepts them -- 12 bytes per vertex instead of GL_T2F_N3F_V3F's 32.
+    Triangles are indexed so that the (slices + 1) x (stacks + 1) grid
+    vertices are shared; the indices are 16-bit whenever the grid has at
+    most 65 536 vertices.
+    """
+    global sphere_vbo, sphere_ibo, sphere_index_count, sphere_index_type
+    global sphere_vao, sphere_attrib_type, sphere_stride, sphere_xyz_offset
+
+    theta = np.linspace(+0.0, +2.0 * math.pi, slices + +1)  # around the axis
+    rho = np.linspace(+0.0, math.pi, stacks + +1)           # pole to pole
+    sin_rho = np.sin(rho)[:, None]
+
+    # gluSphere places its poles on Z; rotate (x, y, z) -> (x, z, -y)
+    x = -np.sin(theta)[None, :] * sin_rho
+    y = np.cos(theta)[None, :] * sin_rho
+    z = np.cos(rho)[:, None] * np.ones_like(theta)[None, :]
+
+    verts = np.zeros((stacks + +1, slices + +1, +6), dtype=np.float32)
+    verts[..., +0] = (np.arange(slices + +1) / float(slices))[None, :]
+    verts[..., +1] = (+1.0 - np.arange(stacks + +1) / float(stacks))[:, None]
+    verts[..., +2] = x
+    verts[..., +3] = z
+    verts[..., +4] = -y
+
+    # Every attribute lies in [-1, 1], well within half-float precision
+    if glInitHalfFloatVertexARB():
+        verts = verts.astype(np.float16)
+        sphere_attrib_type = GL_HALF_FLOAT
+    else:
+        sphere_attrib_type = GL_FLOAT
+    sphere_stride = verts.shape[-1] * verts.itemsize
+    sphere_xyz_offset = +2 * verts.itemsize     # after (u, v)
+
+    # Two triangles per grid cell
+    idx = np.arange((stacks + +1) * (slices + +1), dtype=np.uint32)
+    idx = idx.reshape(stacks + +1, slices + +1)
+    a = idx[:-1, :-1]
+    b = idx[+1:, :-1]
+    c = idx[:-1, +1:]
+    d = idx[+1:, +1:]
+    tris = np.stack((a, b, c, c, b, d), axis=-1).ravel()
+
+    # 16-bit indices halve the index buffer whenever the grid fits
+    if idx.size <= +65536:
+        tris = tris.astype(np.uint16)
+        sphere_index_type = GL_UNSIGNED_SHORT
+    else:
+        sphere_index_type = GL_UNSIGNED_INT
+
+    sphere_vbo = glGenBuffers(+1)
+    glBindBuffer(GL_ARRAY_BUFFER, sphere_vbo)
+    glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
+
+    sphere_ibo = glGenBuffers(+1)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, sphere_ibo)
+    glBufferData(GL_ELEMENT_ARRAY_BUFFER, tris.nbytes, tris, GL_STATIC_DRAW)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, +0)
+
+    sphere_index_count = tris.size
+
+    # Record the buffer bindings and array pointers once in a VAO (GL 3.0+)
+    # so each draw is a single bind instead of re-specifying the layout
+    if bool(glGenVertexArrays):
+        sphere_vao = glGenVertexArrays(+1)
+        glBindVertexArray(sphere_vao)
+        glBindBuffer(GL_ARRAY_BUFFER, sphere_vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, sphere_ibo)
+        _sphere_pointers()
+        glBindVertexArray(+0)
+        glBindBuffer(GL_ARRAY_BUFFER, +0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, +0)
+
+
+def build_sphere(filepath, radius, has_alpha=False,
+                 alpha_from_luminance=False):
+    """Load the texture for a sphere of *radius*.
+
+    Returns a (texture id, radius) pair for draw_sphere(); the geometry
+    itself is the shared unit sphere, scaled in the modelview matrix.
     """
-    dl = glGenLists(+1)
-    q = gluNewQuadric()
-    gluQuadricDrawStyle(q, GLU_FILL)
-    gluQuadricNormals(q, GLU_SMOOTH)
-    gluQuadricTexture(q, GL_TRUE)
-
     tex_id = load_texture(filepath, has_alpha=has_alpha,
                           alpha_from_luminance=alpha_from_luminance)
+    return tex_id, radius
+
+
+def _sphere_pointers():
+    """Enable and point the texcoord, normal and vertex arrays into the
+    bound sphere VBO (normals alias the unit-sphere positions)."""
+    xyz = ctypes.c_void_p(sphere_xyz_offset)
+    glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+    glTexCoordPointer(+2, sphere_attrib_type, sphere_stride,
+                      ctypes.c_void_p(+0))
+    glEnableClientState(GL_NORMAL_ARRAY)
+    glNormalPointer(sphere_attrib_type, sphere_stride, xyz)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(+3, sphere_attrib_type, sphere_stride, xyz)
+
+
+def draw_unit_sphere():
+    """Draw the shared unit sphere with the current GL state (one call)."""
+    if sphere_vao is not None:
+        glBindVertexArray(sphere_vao)
+        glDrawElements(GL_TRIANGLES, sphere_index_count, sphere_index_type,
+                       ctypes.c_void_p(+0))
+        glBindVertexArray(+0)
+        return
 
-    glNewList(dl, GL_COMPILE)
+    glBindBuffer(GL_ARRAY_BUFFER, sphere_vbo)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, sphere_ibo)
+    _sphere_pointers()
+    glDrawElements(GL_TRIANGLES, sphere_index_count, sphere_index_type,
+                   ctypes.c_void_p(+0))
+    glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+    glDisableClientState(GL_NORMAL_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, +0)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
+
+
+def draw_sphere(sphere):
+    """Draw a textured sphere built by build_sphere()."""
+    tex_id, radius = sphere
     glEnable(GL_TEXTURE_2D)
     glBindTexture(GL_TEXTURE_2D, tex_id)
     glPushMatrix()
-    glRotatef(-90.0, +1.0, +0.0, +0.0)
-    gluSphere(q, radius, SPHERE_SLICES, SPHERE_STACKS)
+    glScalef(radius, radius, radius)
+    draw_unit_sphere()
     glPopMatrix()
     glDisable(GL_TEXTURE_2D)
-    glEndList()
-
-    gluDeleteQuadric(q)
-    return dl
 
 
 # ===================================================================
-#  Saturn ring display-list builder
+#  Screen quad (shared by the corona and the sky)
 # ===================================================================
 
-def build_ring_list(filepath, inner, outer, segments=+120):
-    """Create a display list for a flat textured ring (annulus) in the XZ plane.
+# Unit quad corners, drawn as a GL_TRIANGLE_STRIP
+QUAD_CORNERS = np.array([(-1.0, -1.0), (+1.0, -1.0),
+                         (-1.0, +1.0), (+1.0, +1.0)], dtype=np.float32)
 
-    The ring is built as a GL_TRIANGLE_STRIP between *inner* and *outer*
-    radii, with the texture mapped radially.
-    """
-    dl = glGenLists(+1)
-    tex_id = load_texture(filepath, has_alpha=True)
 
-    glNewList(dl, GL_COMPILE)
-    glEnable(GL_TEXTURE_2D)
-    glBindTexture(GL_TEXTURE_2D, tex_id)
-    glEnable(GL_BLEND)
-    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+def build_quad_vbo():
+    """Upload QUAD_CORNERS once; the shaders place the corners."""
+    global quad_vbo
+    quad_vbo = glGenBuffers(+1)
+    glBindBuffer(GL_ARRAY_BUFFER, quad_vbo)
+    glBufferData(GL_ARRAY_BUFFER, QUAD_CORNERS.nbytes, QUAD_CORNERS,
+                 GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
 
-    glBegin(GL_TRIANGLE_STRIP)
-    for i in range(segments + +1):
-        theta = +2.0 * math.pi * i / segments
-        cos_t = math.cos(theta)
-        sin_t = math.sin(theta)
-        # Texture: u maps around the ring, v maps inner->outer
-        u = float(i) / float(segments)
 
-        # Inner vertex
-        glTexCoord2f(u, +0.0)
-        glVertex3f(inner * cos_t, +0.0, inner * sin_t)
+def draw_quad():
+    """Draw the shared quad (the bound shader positions it)."""
+    glBindBuffer(GL_ARRAY_BUFFER, quad_vbo)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(+2, GL_FLOAT, +0, ctypes.c_void_p(+0))
+    glDrawArrays(GL_TRIANGLE_STRIP, +0, len(QUAD_CORNERS))
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
 
-        # Outer vertex
-        glTexCoord2f(u, +1.0)
-        glVertex3f(outer * cos_t, +0.0, outer * sin_t)
-    glEnd()
 
-    glDisable(GL_BLEND)
-    glDisable(GL_TEXTURE_2D)
-    glEndList()
+# ===================================================================
+#  Sun corona glow (ray-cast billboard)
+# ===================================================================
 
-    return dl
+# Additive corona shells around the Sun: (radius, r, g, b, a)
+GLOW_LAYERS = np.array([
+    (R_SUN * +1.12, +1.0,  +0.85, +0.4,  +0.12),
+    (R_SUN * +1.28, +1.0,  +0.7,  +0.2,  +0.06),
+    (R_SUN * +1.50, +0.9,  +0.5,  +0.15, +0.03),
+], dtype=np.float32)
+
+# GLSL 1.20 shaders that draw every shell with one camera-facing quad.
+# The vertex shader sizes the quad to the outer shell's silhouette; the
+# fragment shader intersects each view ray with the shells analytically.
+# A shell adds its colour once for its near side and once more for its
+# far side unless the Sun hides it -- what the additive sphere draws
+# produced.  Every other body lies outside the outer shell, so testing
+# the outer shell's near-side depth hides the corona behind them.
+GLOW_VERTEX_SHADER = """
+#version 120
+uniform float glow_radius[%(n)d];
+varying vec3 pos;       // eye-space point on the billboard
+varying vec3 centre;    // eye-space centre of the Sun
+void main()
+{
+    centre = (gl_ModelViewMatrix * vec4(0.0, 0.0, 0.0, 1.0)).xyz;
+    // Radius of the outer shell's silhouette cone at the Sun's distance
+    float d = length(centre);
+    float r = glow_radius[%(n)d - 1];
+    float half_size = r * d / sqrt(d * d - r * r);
+    vec3 axis = centre / d;
+    vec3 right = normalize(cross(axis, vec3(0.0, 1.0, 0.0)));
+    vec3 up = cross(right, axis);
+    pos = centre + half_size * (gl_Vertex.x * right + gl_Vertex.y * up);
+    gl_Position = gl_ProjectionMatrix * vec4(pos, 1.0);
+}
+""" % {"n": len(GLOW_LAYERS)}
+
+GLOW_FRAGMENT_SHADER = """
+#version 120
+uniform float glow_radius[%(n)d];
+uniform vec4 glow_color[%(n)d];
+uniform float sun_radius;
+varying vec3 pos;
+varying vec3 centre;
+void main()
+{
+    // Squared distance between the Sun's centre and the view ray
+    vec3 d = normalize(pos);
+    float b = dot(centre, d);
+    float h2 = dot(centre, centre) - b * b;
+    float outer = glow_radius[%(n)d - 1];
+    if (h2 >= outer * outer)
+        discard;
+
+    float sides = h2 < sun_radius * sun_radius ? 1.0 : 2.0;
+    vec3 sum = vec3(0.0);
+    for (int i = 0; i < %(n)d; ++i)
+        if (h2 < glow_radius[i] * glow_radius[i])
+            sum += glow_color[i].rgb * glow_color[i].a * sides;
+
+    vec4 clip = gl_ProjectionMatrix
+              * vec4((b - sqrt(outer * outer - h2)) * d, 1.0);
+    gl_FragDepth = 0.5 + 0.5 * clip.z / clip.w;
+    gl_FragColor = vec4(sum, 1.0);
+}
+""" % {"n": len(GLOW_LAYERS)}
+
+
+def build_glow():
+    """Compile the corona shader and load the shells into its uniforms.
+
+    On failure glow_program stays None and draw_glow() falls back to one
+    scaled sphere draw per shell.
+    """
+    global glow_program
 
+    try:
+        program = shaders.compileProgram(
+            shaders.compileShader(GLOW_VERTEX_SHADER, GL_VERTEX_SHADER),
+            shaders.compileShader(GLOW_FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+        )
+    except Exception as exc:
+        print("Glow shader unavailable, drawing one shell at a time:", exc)
+        return
+    glUseProgram(program)
+    glUniform1fv(glGetUniformLocation(program, "glow_radius"),
+                 len(GLOW_LAYERS), np.ascontiguousarray(GLOW_LAYERS[:, +0]))
+    glUniform4fv(glGetUniformLocation(program, "glow_color"),
+                 len(GLOW_LAYERS), np.ascontiguousarray(GLOW_LAYERS[:, +1:]))
+    glUniform1f(glGetUniformLocation(program, "sun_radius"), R_SUN)
+    glUseProgram(+0)
+    glow_program = program
 
-# ===================================================================
-#  Sun corona glow sphere
-# ===================================================================
 
-def build_glow_list():
-    """Create a display list for a plain (untextured) unit sphere.
+def draw_glow():
+    """Draw the Sun's additive, semi-transparent corona shells.
 
-    Used to render the Sun's corona glow by drawing this sphere at
-    various scales with semi-transparent additive colour.
+    Expects display()'s blended phase (lighting off, blending on, depth
+    writes off) and switches the blend function to additive.
     """
-    dl = glGenLists(+1)
-    q = gluNewQuadric()
-    gluQuadricDrawStyle(q, GLU_FILL)
-    gluQuadricNormals(q, GLU_SMOOTH)
-    gluQuadricTexture(q, GL_FALSE)
-
-    glNewList(dl, GL_COMPILE)
-    gluSphere(q, +1.0, +40, +40)
-    glEndList()
+    glBlendFunc(GL_SRC_ALPHA, GL_ONE)
 
-    gluDeleteQuadric(q)
-    return dl
+    if glow_program is not None:
+        glUseProgram(glow_program)
+        draw_quad()
+        glUseProgram(+0)
+    else:
+        for scale, gr, gg, gb, ga in GLOW_LAYERS:
+            glPushMatrix()
+            glScalef(scale, scale, scale)
+            glColor4f(gr, gg, gb, ga)
+            draw_unit_sphere()
+            glPopMatrix()
 
 
 # ===================================================================
-#  Milky Way skysphere
+#  Saturn ring (VBO)
 # ===================================================================
 
-def build_sky_sphere_list(filepath, radius):
-    """Create a display list for a large inverted sphere textured with the
-    Milky Way panorama.
+def build_ring(filepath, inner, outer, segments=+120):
+    """Build a flat textured ring (annulus) in the XZ plane as a VBO.
+
+    The ring is a GL_TRIANGLE_STRIP alternating between *inner* and
+    *outer* radii, with u mapped around the ring and v from inner (0) to
+    outer (1).  Vertices are interleaved as GL_T2F_V3F (u, v, x, y, z).
 
-    The sphere faces *inward* (normals reversed via gluQuadricOrientation)
-    so the texture is visible from inside.  It is drawn without lighting
-    to act as a static photographic backdrop behind everything else.
+    Returns
+    -------
+    tuple
+        (texture id, vbo, vertex count) for draw_ring().
     """
-    dl = glGenLists(+1)
-    q = gluNewQuadric()
-    gluQuadricDrawStyle(q, GLU_FILL)
-    gluQuadricNormals(q, GLU_SMOOTH)
-    gluQuadricTexture(q, GL_TRUE)
-    gluQuadricOrientation(q, GLU_INSIDE)
+    tex_id = load_texture(filepath, has_alpha=True)
+
+    i = np.arange(segments + +1, dtype=np.float32)
+    theta = +2.0 * math.pi * i / segments
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
 
-    tex_id = load_texture(filepath)
+    verts = np.zeros((segments + +1, +2, +5), dtype=np.float32)
+    verts[:, :, +0] = (i / segments)[:, None]
+    verts[:, +1, +1] = +1.0
+    for k, radius in enumerate((inner, outer)):
+        verts[:, k, +2] = radius * cos_t
+        verts[:, k, +4] = radius * sin_t
 
-    glNewList(dl, GL_COMPILE)
+    vbo = glGenBuffers(+1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
+
+    return tex_id, vbo, +2 * (segments + +1)
+
+
+def draw_ring(ring):
+    """Draw a ring built by build_ring() (expects alpha blending on)."""
+    tex_id, vbo, count = ring
     glEnable(GL_TEXTURE_2D)
     glBindTexture(GL_TEXTURE_2D, tex_id)
-    glPushMatrix()
-    glRotatef(-90.0, +1.0, +0.0, +0.0)
-    gluSphere(q, radius, +64, +64)
-    glPopMatrix()
+
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glInterleavedArrays(GL_T2F_V3F, +0, ctypes.c_void_p(+0))
+    glDrawArrays(GL_TRIANGLE_STRIP, +0, count)
+    glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
+
     glDisable(GL_TEXTURE_2D)
-    glEndList()
 
-    gluDeleteQuadric(q)
-    return dl
+
+# ===================================================================
+#  Milky Way backdrop
+# ===================================================================
+
+# GLSL 1.20 shaders that draw the sky as one full-screen quad on the far
+# plane (depth 1.0; with GL_LEQUAL it passes against the cleared depth
+# buffer while depth testing stays enabled all frame).  Each fragment
+# casts its view ray from the eye to the sky sphere and turns the hit
+# point into the same (u, v) the shared sphere mesh would carry there.
+SKY_VERTEX_SHADER = """
+#version 120
+varying vec3 eye;
+varying vec3 ray;
+void main()
+{
+    // The shared quad's corners are already the NDC screen corners
+    gl_Position = vec4(gl_Vertex.xy, 1.0, 1.0);
+    // View ray in eye space, turned into world space by the inverse view
+    // rotation; the eye is the inverse view's translation column
+    vec4 far_pt = gl_ProjectionMatrixInverse * gl_Position;
+    ray = mat3(gl_ModelViewMatrixInverse) * (far_pt.xyz / far_pt.w);
+    eye = gl_ModelViewMatrixInverse[3].xyz;
+}
+"""
+
+SKY_FRAGMENT_SHADER = """
+#version 120
+uniform sampler2D sky_map;
+varying vec3 eye;
+varying vec3 ray;
+const float RADIUS = %(radius)r;
+const float PI = 3.14159265358979;
+void main()
+{
+    // Exit point of the ray through the sphere (the eye is inside it)
+    vec3 d = normalize(ray);
+    float b = dot(eye, d);
+    float t = -b + sqrt(b * b - dot(eye, eye) + RADIUS * RADIUS);
+    vec3 p = (eye + t * d) / RADIUS;
+
+    // Inverse of build_unit_sphere_vbo's (u, v) -> (x, y, z) mapping.
+    // Of the two u ranges, use whichever is continuous at this pixel so
+    // the mip level does not jump across the seam; off the seams their
+    // derivatives only differ by rounding, so ties go to u_b.
+    float u_a = atan(-p.x, -p.z) / (2.0 * PI);
+    float u_b = fract(u_a);
+    float u = fwidth(u_a) < fwidth(u_b) - 0.25 ? u_a : u_b;
+    float v = 1.0 - acos(clamp(p.y, -1.0, 1.0)) / PI;
+    gl_FragColor = texture2D(sky_map, vec2(u, v));
+}
+""" % {"radius": SKY_SPHERE_RADIUS}
+
+
+def build_sky_program():
+    """Compile the far-plane sky shader; on failure sky_program stays None
+    and draw_sky() draws the sky sphere with depth testing switched off
+    instead."""
+    global sky_program
+
+    try:
+        program = shaders.compileProgram(
+            shaders.compileShader(SKY_VERTEX_SHADER, GL_VERTEX_SHADER),
+            shaders.compileShader(SKY_FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+        )
+    except Exception as exc:
+        print("Sky shader unavailable, drawing it without depth test:", exc)
+        return
+    glUseProgram(program)
+    glUniform1i(glGetUniformLocation(program, "sky_map"), +0)
+    glUseProgram(+0)
+    sky_program = program
+
+
+def draw_sky():
+    """Draw the Milky Way behind everything else (unlit).
+
+    With the shader this is four vertices; only the fallback rasterises
+    the sky sphere itself.
+    """
+    glDisable(GL_LIGHTING)
+    if sky_program is not None:
+        glDepthFunc(GL_LEQUAL)
+        glUseProgram(sky_program)
+        glBindTexture(GL_TEXTURE_2D, sph_milky_way[+0])
+        draw_quad()
+        glUseProgram(+0)
+        glDepthFunc(GL_LESS)
+    else:
+        glColor3f(+1.0, +1.0, +1.0)
+        glDisable(GL_DEPTH_TEST)
+        draw_sphere(sph_milky_way)
+        glEnable(GL_DEPTH_TEST)
 
 
 # ===================================================================
 #  Starfield
 # ===================================================================
 
+# Three size buckets for visual depth: (min_base, max_base, point_size)
+STAR_SIZE_BUCKETS = [
+    (+0.0, +1.5, +1.2),
+    (+1.5, +2.0, +2.2),
+    (+2.0, +3.0, +3.5),
+]
+
+# GLSL 1.20 vertex shader that takes each star's point size and twinkle
+# parameters from a static vertex attribute and its tint from gl_Color, so
+# all buckets go out in one draw and nothing is re-uploaded per frame.
+# There is no fragment shader: the fixed-function stage keeps
+# GL_POINT_SMOOTH coverage intact.
+STAR_VERTEX_SHADER = """
+#version 120
+attribute vec3 star_attr;     // (point_size, speed, phase)
+uniform float time;
+void main()
+{
+    gl_Position = ftransform();
+    gl_PointSize = star_attr.x;
+    float b = %(lo)r + %(span)r * (0.5 + 0.5 * sin(star_attr.y * time
+                                                  + star_attr.z));
+    gl_FrontColor = vec4(min(b * gl_Color.rgb, 1.0), 1.0);
+}
+""" % {"lo": STAR_MIN_BRIGHTNESS,
+       "span": STAR_MAX_BRIGHTNESS - STAR_MIN_BRIGHTNESS}
+
+
+def build_star_program():
+    """Compile the twinkle shader; return None if GLSL is unavailable."""
+    try:
+        return shaders.compileProgram(
+            shaders.compileShader(STAR_VERTEX_SHADER, GL_VERTEX_SHADER))
+    except Exception as exc:
+        print("Star shader unavailable, drawing one pass per size:", exc)
+        return None
+
+
 def create_starfield():
     """Populate the starfield arrays with random positions on a large sphere
-    and random twinkle parameters."""
+    and random twinkle parameters, then upload them to static VBOs."""
     global star_positions, star_phases, star_speeds, star_base_sizes
-
-    star_positions  = []
-    star_phases     = []
-    star_speeds     = []
-    star_base_sizes = []
-
-    for _ in range(NUM_STARS):
-        # Uniform distribution on a sphere (Marsaglia method)
-        while True:
-            u = random.uniform(-1.0, +1.0)
-            v = random.uniform(-1.0, +1.0)
-            s = u * u + v * v
-            if s < +1.0:
-                break
-        sq = +2.0 * math.sqrt(+1.0 - s)
-        x = STAR_SPHERE_RADIUS * u * sq
-        y = STAR_SPHERE_RADIUS * v * sq
-        z = STAR_SPHERE_RADIUS * (+1.0 - +2.0 * s)
-        star_positions.append((x, y, z))
-
-        star_phases.append(random.uniform(+0.0, +2.0 * math.pi))
-        star_speeds.append(random.uniform(STAR_TWINKLE_SPEED_MIN,
-                                          STAR_TWINKLE_SPEED_MAX))
-        star_base_sizes.append(random.uniform(+1.0, +2.5))
+    global star_tints, star_colors, star_buckets, star_vbo, star_color_vbo
+    global star_attr_vbo, star_program, star_attr_loc, star_time_loc
+
+    # Uniform distribution on a sphere: uniform azimuth, and cos(polar)
+    # uniform in [-1, 1].  Every attribute is drawn in one vectorised call.
+    rng = np.random.default_rng(STAR_SEED)
+    theta = rng.uniform(+0.0, +2.0 * math.pi, NUM_STARS)
+    phi   = np.arccos(rng.uniform(-1.0, +1.0, NUM_STARS))
+    r = STAR_SPHERE_RADIUS
+    positions = np.stack((r * np.sin(phi) * np.cos(theta),
+                          r * np.sin(phi) * np.sin(theta),
+                          r * np.cos(phi)), axis=+1).astype(np.float32)
+    phases = rng.uniform(+0.0, +2.0 * math.pi, NUM_STARS)
+    speeds = rng.uniform(STAR_TWINKLE_SPEED_MIN, STAR_TWINKLE_SPEED_MAX,
+                         NUM_STARS)
+    sizes  = rng.uniform(+1.0, +2.5, NUM_STARS)
+
+    # Group the stars by size bucket with a stable sort, so each bucket is
+    # a contiguous index range drawn by a single glDrawArrays call.
+    bucket_of = np.digitize(sizes, [hi for _lo, hi, _pt in STAR_SIZE_BUCKETS])
+    order = np.argsort(bucket_of, kind="stable")
+    counts = np.bincount(bucket_of, minlength=len(STAR_SIZE_BUCKETS))
+
+    star_positions  = positions[order]
+    star_phases     = phases[order]
+    star_speeds     = speeds[order]
+    star_base_sizes = sizes[order]
+
+    star_buckets = []
+    first = +0
+    for (_lo, _hi, pt_size), count in zip(STAR_SIZE_BUCKETS, counts):
+        star_buckets.append((first, int(count), pt_size))
+        first += int(count)
+
+    # Constant warm/cool tint: bigger stars lean slightly warmer
+    warmth = star_base_sizes / +2.5
+    star_tints = np.column_stack((+0.9 + +0.1 * warmth,
+                                  np.ones(NUM_STARS),
+                                  +1.1 - +0.1 * warmth))
+    star_colors = np.empty((NUM_STARS, +3), dtype=np.float32)
+
+    # Positions never change: upload once
+    star_vbo = glGenBuffers(+1)
+    glBindBuffer(GL_ARRAY_BUFFER, star_vbo)
+    glBufferData(GL_ARRAY_BUFFER, star_positions.nbytes, star_positions,
+                 GL_STATIC_DRAW)
+    star_color_vbo = glGenBuffers(+1)
+    glBindBuffer(GL_ARRAY_BUFFER, star_color_vbo)
+
+    star_program = build_star_program()
+    if star_program is not None:
+        # The shader twinkles each star itself: tints, bucket point sizes
+        # and twinkle parameters are all uploaded once.
+        tints = star_tints.astype(np.float32)
+        glBufferData(GL_ARRAY_BUFFER, tints.nbytes, tints, GL_STATIC_DRAW)
+        attrs = np.column_stack((
+            np.repeat([pt for _lo, _hi, pt in STAR_SIZE_BUCKETS], counts),
+            star_speeds, star_phases)).astype(np.float32)
+        star_attr_vbo = glGenBuffers(+1)
+        glBindBuffer(GL_ARRAY_BUFFER, star_attr_vbo)
+        glBufferData(GL_ARRAY_BUFFER, attrs.nbytes, attrs, GL_STATIC_DRAW)
+        star_attr_loc = glGetAttribLocation(star_program, "star_attr")
+        star_time_loc = glGetUniformLocation(star_program, "time")
+    else:
+        # Colours are re-streamed each frame into their own buffer
+        glBufferData(GL_ARRAY_BUFFER, star_colors.nbytes, None,
+                     GL_STREAM_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
 
 
 def draw_starfield(t):
     """Draw every star as a GL point with brightness oscillating over time.
 
-    Stars are rendered in three size passes (small, medium, large) to
-    create visual depth.  Each star has a subtle warm/cool colour tint.
+    Stars come in three sizes (small, medium, large) to create visual
+    depth.  Each star has a subtle warm/cool colour tint.  With the
+    twinkle shader every buffer is static: the brightness is computed on
+    the GPU and every star goes out in one glDrawArrays.  Otherwise all
+    brightness values are computed in one vectorised NumPy pass, streamed
+    to the colour VBO, and each size is its own glDrawArrays pass.
 
     Parameters
     ----------
@@ -539,118 +1132,160 @@ def draw_starfield(t):
     """
     glDisable(GL_TEXTURE_2D)
     glDisable(GL_LIGHTING)
+    # GL_POINT_SMOOTH is ignored while multisampling; keep the stars round
+    glDisable(GL_MULTISAMPLE)
     glEnable(GL_POINT_SMOOTH)
     glHint(GL_POINT_SMOOTH_HINT, GL_NICEST)
     glEnable(GL_BLEND)
     glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
-    # Three size buckets for visual depth: (min_base, max_base, point_size)
-    buckets = [
-        (+0.0, +1.5, +1.2),
-        (+1.5, +2.0, +2.2),
-        (+2.0, +3.0, +3.5),
-    ]
-
-    for lo, hi, pt_size in buckets:
-        glPointSize(pt_size)
-        glBegin(GL_POINTS)
-        for i in range(NUM_STARS):
-            bs = star_base_sizes[i]
-            if bs < lo or bs >= hi:
-                continue
-
-            phase = star_speeds[i] * t + star_phases[i]
-            brightness = STAR_MIN_BRIGHTNESS + (
-                STAR_MAX_BRIGHTNESS - STAR_MIN_BRIGHTNESS
-            ) * (+0.5 + +0.5 * math.sin(phase))
-
-            warmth = bs / +2.5
-            r = brightness * (+0.9 + +0.1 * warmth)
-            g = brightness
-            b = brightness * (+1.0 - +0.1 * warmth + +0.1)
-            glColor3f(min(r, +1.0), min(g, +1.0), min(b, +1.0))
-
-            x, y, z = star_positions[i]
-            glVertex3f(x, y, z)
-        glEnd()
+    glBindBuffer(GL_ARRAY_BUFFER, star_color_vbo)
+    if star_program is None:
+        brightness = STAR_MIN_BRIGHTNESS + (
+            STAR_MAX_BRIGHTNESS - STAR_MIN_BRIGHTNESS
+        ) * (+0.5 + +0.5 * np.sin(star_speeds * t + star_phases))
+        np.minimum(brightness[:, None] * star_tints, +1.0, out=star_colors,
+                   casting="same_kind")
+        glBufferSubData(GL_ARRAY_BUFFER, +0, star_colors.nbytes, star_colors)
+    glEnableClientState(GL_COLOR_ARRAY)
+    glColorPointer(+3, GL_FLOAT, +0, ctypes.c_void_p(+0))
+
+    glBindBuffer(GL_ARRAY_BUFFER, star_vbo)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(+3, GL_FLOAT, +0, ctypes.c_void_p(+0))
+
+    if star_program is not None:
+        # One draw: the shader reads each star's size and twinkle from
+        # star_attr_vbo, so only the clock changes per frame
+        glUseProgram(star_program)
+        glUniform1f(star_time_loc, t)
+        glEnable(GL_VERTEX_PROGRAM_POINT_SIZE)
+        glBindBuffer(GL_ARRAY_BUFFER, star_attr_vbo)
+        glEnableVertexAttribArray(star_attr_loc)
+        glVertexAttribPointer(star_attr_loc, +3, GL_FLOAT, GL_FALSE, +0,
+                              ctypes.c_void_p(+0))
+        glDrawArrays(GL_POINTS, +0, NUM_STARS)
+        glDisableVertexAttribArray(star_attr_loc)
+        glDisable(GL_VERTEX_PROGRAM_POINT_SIZE)
+        glUseProgram(+0)
+    else:
+        for first, count, pt_size in star_buckets:
+            glPointSize(pt_size)
+            glDrawArrays(GL_POINTS, first, count)
+
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glDisableClientState(GL_COLOR_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
 
     glDisable(GL_BLEND)
     glDisable(GL_POINT_SMOOTH)
+    glEnable(GL_MULTISAMPLE)
 
 
 # ===================================================================
 #  Orbit trails
 # ===================================================================
 
-def draw_orbit_ring(radius, r, g, b, incl_rad=+0.0, node_rad=+0.0):
-    """Draw a faint, anti-aliased orbit circle tilted to the correct plane.
+# Faint colour of each planet's orbit ring, Mercury .. Neptune
+ORBIT_COLORS = [
+    (+0.7, +0.7, +0.7),
+    (+0.9, +0.7, +0.4),
+    (+0.3, +0.5, +0.9),
+    (+0.9, +0.4, +0.3),
+    (+0.8, +0.7, +0.5),
+    (+0.8, +0.8, +0.5),
+    (+0.5, +0.8, +0.9),
+    (+0.3, +0.4, +0.9),
+]
+ORBIT_STRIDE = +7 * +4   # bytes per (r, g, b, a, x, y, z) float32 vertex
+
+
+def build_orbit_rings_vbo():
+    """Bake every planet's orbit circle into one static VBO.
+
+    The rings never move, so each unit circle is scaled to the planet's
+    distance and tilted into its orbital plane -- Ry(node) * Rx(incl), the
+    same matrices the planets use -- once here.  Vertices are interleaved
+    as (r, g, b, a, x, y, z) so draw_all_orbits() can draw all of them
+    with a single glMultiDrawArrays call.
+    """
+    global orbit_vbo, orbit_firsts, orbit_counts
 
-    The ring is drawn in the XZ plane and then rotated by *node_rad*
-    (ascending node) around Y followed by *incl_rad* (inclination)
-    around X so it sits at the real orbital tilt.
+    n_rings = len(ORBIT_COLORS)
+    theta = np.linspace(+0.0, +2.0 * math.pi, ORBIT_SEGMENTS, endpoint=False)
+    circle = np.column_stack((np.cos(theta), np.zeros_like(theta),
+                              np.sin(theta))).astype(np.float32)
+
+    verts = np.empty((n_rings, ORBIT_SEGMENTS, +7), dtype=np.float32)
+    verts[..., :+3] = np.array(ORBIT_COLORS, dtype=np.float32)[:, None, :]
+    verts[..., +3] = ORBIT_ALPHA
+    # Row vectors times the stored (transposed) plane rotations
+    verts[..., +4:] = (_ORBIT_RADII[:n_rings, None, None] * circle
+                       @ _ORBIT_PLANES_T[:n_rings, :+3, :+3])
+
+    orbit_vbo = glGenBuffers(+1)
+    glBindBuffer(GL_ARRAY_BUFFER, orbit_vbo)
+    glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
+
+    orbit_firsts = np.arange(n_rings, dtype=np.int32) * ORBIT_SEGMENTS
+    orbit_counts = np.full(n_rings, ORBIT_SEGMENTS, dtype=np.int32)
+
+
+def draw_all_orbits():
+    """Draw faint, anti-aliased orbit paths for every planet around the Sun.
+
+    Expects display()'s blended phase (lighting off, alpha blending on).
     """
-    glDisable(GL_TEXTURE_2D)
-    glDisable(GL_LIGHTING)
-    glEnable(GL_BLEND)
-    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
     glEnable(GL_LINE_SMOOTH)
     glHint(GL_LINE_SMOOTH_HINT, GL_NICEST)
     glLineWidth(+1.2)
 
-    glPushMatrix()
-    # Tilt the drawing plane to match the real orbital inclination
-    glRotatef(math.degrees(node_rad), +0.0, +1.0, +0.0)
-    glRotatef(math.degrees(incl_rad), +1.0, +0.0, +0.0)
+    glBindBuffer(GL_ARRAY_BUFFER, orbit_vbo)
+    glEnableClientState(GL_COLOR_ARRAY)
+    glColorPointer(+4, GL_FLOAT, ORBIT_STRIDE, ctypes.c_void_p(+0))
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(+3, GL_FLOAT, ORBIT_STRIDE, ctypes.c_void_p(+4 * +4))
 
-    glBegin(GL_LINE_LOOP)
-    glColor4f(r, g, b, ORBIT_ALPHA)
-    for i in range(ORBIT_SEGMENTS):
-        theta = +2.0 * math.pi * i / ORBIT_SEGMENTS
-        glVertex3f(radius * math.cos(theta), +0.0, radius * math.sin(theta))
-    glEnd()
+    glMultiDrawArrays(GL_LINE_LOOP, orbit_firsts, orbit_counts,
+                      len(orbit_counts))
 
-    glPopMatrix()
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glDisableClientState(GL_COLOR_ARRAY)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
 
     glLineWidth(+1.0)
     glDisable(GL_LINE_SMOOTH)
-    glDisable(GL_BLEND)
-
-
-def draw_all_orbits():
-    """Draw orbit paths for every planet around the Sun."""
-    # (radius, r, g, b, inclination, ascending_node)
-    orbits = [
-        (D_MERCURY, +0.7, +0.7, +0.7, INCL_MERCURY, NODE_MERCURY),
-        (D_VENUS,   +0.9, +0.7, +0.4, INCL_VENUS,   NODE_VENUS),
-        (D_EARTH,   +0.3, +0.5, +0.9, INCL_EARTH,   NODE_EARTH),
-        (D_MARS,    +0.9, +0.4, +0.3, INCL_MARS,     NODE_MARS),
-        (D_JUPITER, +0.8, +0.7, +0.5, INCL_JUPITER,  NODE_JUPITER),
-        (D_SATURN,  +0.8, +0.8, +0.5, INCL_SATURN,   NODE_SATURN),
-        (D_URANUS,  +0.5, +0.8, +0.9, INCL_URANUS,   NODE_URANUS),
-        (D_NEPTUNE, +0.3, +0.4, +0.9, INCL_NEPTUNE,  NODE_NEPTUNE),
-    ]
-    for dist, r, g, b, incl, node in orbits:
-        draw_orbit_ring(dist, r, g, b, incl, node)
 
 
 # ===================================================================
 #  Lighting setup (Sun as point light)
 # ===================================================================
 
+# Constant light / material parameters, converted to GLfloat arrays once
+# so the per-frame calls skip PyOpenGL's list marshalling
+_LIGHT_POSITION = (GLfloat * +4)(+0.0,  +0.0,  +0.0,  +1.0)
+_LIGHT_AMBIENT  = (GLfloat * +4)(+0.08, +0.08, +0.10, +1.0)
+_LIGHT_DIFFUSE  = (GLfloat * +4)(+1.0,  +0.98, +0.92, +1.0)
+_LIGHT_SPECULAR = (GLfloat * +4)(+1.0,  +1.0,  +1.0,  +1.0)
+_MAT_SPECULAR   = (GLfloat * +4)(+0.3,  +0.3,  +0.3,  +1.0)
+_SUN_EMIT_ON    = (GLfloat * +4)(+1.0,  +0.95, +0.8,  +1.0)
+_SUN_EMIT_OFF   = (GLfloat * +4)(+0.0,  +0.0,  +0.0,  +1.0)
+
+
 def setup_lighting():
     """Configure a single point light at the origin (the Sun).
 
     GL_LIGHT0 emits white diffuse/specular light; a dim ambient term
-    ensures the dark sides of planets are not completely black.
+    ensures the dark sides of planets are not completely black.  All of
+    this is fixed state, set once from init_gl(); only the light position
+    depends on the camera and is re-sent each frame in display().
     """
-    glEnable(GL_LIGHTING)
     glEnable(GL_LIGHT0)
 
-    # Light at the origin (Sun position in world space)
-    glLightfv(GL_LIGHT0, GL_POSITION, [+0.0, +0.0, +0.0, +1.0])
-    glLightfv(GL_LIGHT0, GL_AMBIENT,  [+0.08, +0.08, +0.10, +1.0])
-    glLightfv(GL_LIGHT0, GL_DIFFUSE,  [+1.0,  +0.98, +0.92, +1.0])
-    glLightfv(GL_LIGHT0, GL_SPECULAR, [+1.0,  +1.0,  +1.0,  +1.0])
+    glLightfv(GL_LIGHT0, GL_AMBIENT,  _LIGHT_AMBIENT)
+    glLightfv(GL_LIGHT0, GL_DIFFUSE,  _LIGHT_DIFFUSE)
+    glLightfv(GL_LIGHT0, GL_SPECULAR, _LIGHT_SPECULAR)
 
     # Attenuation so distant planets receive less light (subtle effect)
     glLightf(GL_LIGHT0, GL_CONSTANT_ATTENUATION,  +1.0)
@@ -660,90 +1295,553 @@ def setup_lighting():
     # Default material -- planets override as needed
     glEnable(GL_COLOR_MATERIAL)
     glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
-    glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [+0.3, +0.3, +0.3, +1.0])
+    glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, _MAT_SPECULAR)
     glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, +25.0)
 
 
+# ===================================================================
+#  Rotation matrices (NumPy, column-major)
+# ===================================================================
+# Each helper returns the 4x4 rotation transposed -- the column-major layout
+# glMultMatrixf expects -- so a chain of glRotatef calls R1 * R2 * R3 becomes
+# one upload of R3t @ R2t @ R1t.
+
+def _rot_x_t(angle):
+    """Return Rx(angle) (radians) transposed."""
+    c, s = math.cos(angle), math.sin(angle)
+    return np.array([[+1.0, +0.0, +0.0, +0.0],
+                     [+0.0, +c,   +s,   +0.0],
+                     [+0.0, -s,   +c,   +0.0],
+                     [+0.0, +0.0, +0.0, +1.0]], dtype=np.float32)
+
+
+def _rot_y_t(angle):
+    """Return Ry(angle) (radians) transposed."""
+    c, s = math.cos(angle), math.sin(angle)
+    return np.array([[+c,   +0.0, -s,   +0.0],
+                     [+0.0, +1.0, +0.0, +0.0],
+                     [+s,   +0.0, +c,   +0.0],
+                     [+0.0, +0.0, +0.0, +1.0]], dtype=np.float32)
+
+
+def _rot_z_t(angle):
+    """Return Rz(angle) (radians) transposed."""
+    c, s = math.cos(angle), math.sin(angle)
+    return np.array([[+c,   +s,   +0.0, +0.0],
+                     [-s,   +c,   +0.0, +0.0],
+                     [+0.0, +0.0, +1.0, +0.0],
+                     [+0.0, +0.0, +0.0, +1.0]], dtype=np.float32)
+
+
+# ===================================================================
+#  Orbital frames (all bodies at once, vectorised with NumPy)
+# ===================================================================
+
+# Row of each body in the per-frame orbit matrix stack.  The Moon's frame
+# is relative to Earth's orbital position, all others to the Sun.
+ORB_MERCURY, ORB_VENUS, ORB_EARTH, ORB_MARS = +0, +1, +2, +3
+ORB_JUPITER, ORB_SATURN, ORB_URANUS, ORB_NEPTUNE, ORB_MOON = +4, +5, +6, +7, +8
+
+
+def _plane_matrix(incl_rad, node_rad):
+    """Return Ry(node) * Rx(incl) -- the tilt of an orbital plane (4x4)."""
+    cn, sn = math.cos(node_rad), math.sin(node_rad)
+    ci, si = math.cos(incl_rad), math.sin(incl_rad)
+    ry = np.array([[+cn, +0.0, +sn, +0.0],
+                   [+0.0, +1.0, +0.0, +0.0],
+                   [-sn, +0.0, +cn, +0.0],
+                   [+0.0, +0.0, +0.0, +1.0]])
+    rx = np.array([[+1.0, +0.0, +0.0, +0.0],
+                   [+0.0, +ci, -si, +0.0],
+                   [+0.0, +si, +ci, +0.0],
+                   [+0.0, +0.0, +0.0, +1.0]])
+    return ry @ rx
+
+
+# Constant orbital-plane tilts and radii, stored transposed (column-major,
+# the layout glMultMatrixf expects) so no per-frame transpose is needed.
+_ORBIT_PLANES_T = np.array([
+    _plane_matrix(INCL_MERCURY, NODE_MERCURY),
+    _plane_matrix(INCL_VENUS,   NODE_VENUS),
+    _plane_matrix(INCL_EARTH,   NODE_EARTH),
+    _plane_matrix(INCL_MARS,    NODE_MARS),
+    _plane_matrix(INCL_JUPITER, NODE_JUPITER),
+    _plane_matrix(INCL_SATURN,  NODE_SATURN),
+    _plane_matrix(INCL_URANUS,  NODE_URANUS),
+    _plane_matrix(INCL_NEPTUNE, NODE_NEPTUNE),
+    _plane_matrix(INCL_MOON,    NODE_MOON),
+], dtype=np.float32).transpose(+0, +2, +1).copy()
+_ORBIT_RADII = np.array([D_MERCURY, D_VENUS, D_EARTH, D_MARS, D_JUPITER,
+                         D_SATURN, D_URANUS, D_NEPTUNE, D_MOON],
+                        dtype=np.float32)
+
+# Scratch buffers reused every frame (no per-frame allocation of matrices)
+_orbit_local_t = np.tile(np.eye(+4, dtype=np.float32),
+                         (len(_ORBIT_RADII), +1, +1))
+orbit_frames = np.empty_like(_orbit_local_t)
+
+
+def update_orbit_frames():
+    """Rebuild every body's orbit matrix from the current orbital angles.
+
+    For each body the matrix is Ry(node) * Rx(incl) * Ry(orbit) * T(dist, 0, 0)
+    -- the same product the separate glRotatef / glTranslatef calls used to
+    build -- computed for all bodies with one vectorised cos/sin pass and one
+    batched matrix product.  Results land in *orbit_frames* (column-major).
+    """
+    angles = ANGLES[:I_MOON_ORB + 1].astype(np.float32)
+    c = np.cos(angles)
+    s = np.sin(angles)
+
+    # Transpose of Ry(orbit) * T(dist): rotation block plus translated column
+    m = _orbit_local_t
+    m[:, +0, +0] = c
+    m[:, +0, +2] = -s
+    m[:, +2, +0] = s
+    m[:, +2, +2] = c
+    m[:, +3, +0] = c * _ORBIT_RADII
+    m[:, +3, +2] = -s * _ORBIT_RADII
+
+    # (P * L)^T = L^T * P^T
+    np.matmul(m, _ORBIT_PLANES_T, out=orbit_frames)
+
+
+# ===================================================================
+#  Frustum culling (bounding spheres, one NumPy test per frame)
+# ===================================================================
+
+# Bounding radius of each body in orbit-frame row order: Earth covers
+# its cloud shell and Saturn its ring
+_BODY_RADII = np.array([R_MERCURY, R_VENUS, R_EARTH * +1.015, R_MARS,
+                        R_JUPITER, SATURN_RING_OUTER, R_URANUS, R_NEPTUNE,
+                        R_MOON], dtype=np.float32)
+
+projection_t = np.eye(+4, dtype=np.float32)   # column-major, see reshape()
+body_visible = np.ones(len(_BODY_RADII), dtype=bool)
+
+
+def capture_projection():
+    """Keep a copy of the current projection matrix for culling."""
+    global projection_t
+    projection_t = np.asarray(glGetFloatv(GL_PROJECTION_MATRIX),
+                              dtype=np.float32).reshape(+4, +4)
+
+
+def update_visibility(view_t):
+    """Flag which bodies' bounding spheres intersect the view frustum.
+
+    The six planes come from the rows of clip = P * V (Gribb-Hartmann);
+    a body is culled when its centre lies more than its radius outside
+    any plane.  Results land in *body_visible*.
+    """
+    clip = (view_t @ projection_t).T
+    planes = np.stack((clip[+3] + clip[+0], clip[+3] - clip[+0],
+                       clip[+3] + clip[+1], clip[+3] - clip[+1],
+                       clip[+3] + clip[+2], clip[+3] - clip[+2]))
+    planes /= np.linalg.norm(planes[:, :+3], axis=+1)[:, None]
+
+    # World-space centres; the Moon's frame is relative to Earth's, so its
+    # local centre goes through Earth's whole frame (row vector, column-
+    # major), exactly as draw_earth() nests draw_moon()
+    centres = orbit_frames[:, +3, :].copy()
+    centres[ORB_MOON] = orbit_frames[ORB_MOON, +3] @ orbit_frames[ORB_EARTH]
+    distances = centres @ planes.T
+    np.all(distances >= -_BODY_RADII[:, None], axis=+1, out=body_visible)
+
+
 # ===================================================================
 #  Helper: draw a generic planet
 # ===================================================================
 
-def draw_planet(orbit_angle, orbit_radius, spin_angle, tilt_rad,
-                display_list, axial_tilt_axis=(+0.0, +0.0, +1.0),
-                incl_rad=+0.0, node_rad=+0.0):
+def draw_planet(orbit_frame, spin_angle, tilt_rad, sphere):
     """Draw a planet at its orbital position with axial tilt and spin.
 
     Parameters
     ----------
-    orbit_angle : float   Orbital angle in radians.
-    orbit_radius : float  Distance from the Sun.
+    orbit_frame : ndarray  Column-major 4x4 orbit matrix (see
+                           update_orbit_frames) placing the planet on its
+                           inclined orbit.
     spin_angle : float    Self-rotation angle in radians.
-    tilt_rad : float      Axial tilt in radians.
-    display_list : int    GL display list for the textured sphere.
-    axial_tilt_axis : tuple  Axis around which to apply axial tilt.
-    incl_rad : float      Orbital inclination to the ecliptic (radians).
-    node_rad : float      Longitude of ascending node (radians).
+    tilt_rad : float      Axial tilt (around local Z) in radians.
+    sphere : tuple        Textured sphere from build_sphere().
     """
     glPushMatrix()
 
-    # 0) Tilt the orbital plane to its real inclination
-    glRotatef(math.degrees(node_rad), +0.0, +1.0, +0.0)
-    glRotatef(math.degrees(incl_rad), +1.0, +0.0, +0.0)
+    # Orbit frame, then axial tilt, then self-rotation around the tilted
+    # local Y axis -- composed in NumPy and uploaded as one matrix
+    glMultMatrixf(_rot_y_t(spin_angle) @ _rot_z_t(tilt_rad) @ orbit_frame)
 
-    # 1) Orbit: rotate frame around Y then translate outward
-    glRotatef(math.degrees(orbit_angle), +0.0, +1.0, +0.0)
-    glTranslatef(orbit_radius, +0.0, +0.0)
+    glColor3f(+1.0, +1.0, +1.0)
+    draw_sphere(sphere)
 
-    # 2) Axial tilt
-    if abs(tilt_rad) > +0.001:
-        glRotatef(math.degrees(tilt_rad),
-                  axial_tilt_axis[0], axial_tilt_axis[1], axial_tilt_axis[2])
+    glPopMatrix()
 
-    # 3) Self-rotation around the (now tilted) local Y axis
-    glRotatef(math.degrees(spin_angle), +0.0, +1.0, +0.0)
 
-    glColor3f(+1.0, +1.0, +1.0)
-    glCallList(display_list)
+# ===================================================================
+#  Batched planets (one instanced draw)
+# ===================================================================
 
-    glPopMatrix()
+# Planets without extra layers, drawn together when instancing is
+# available: (texture, radius, orbit row, axial tilt)
+PLANET_BATCH = [
+    (TEX_MERCURY, R_MERCURY, ORB_MERCURY, +0.0),
+    (TEX_VENUS,   R_VENUS,   ORB_VENUS,   +0.0),
+    (TEX_MARS,    R_MARS,    ORB_MARS,    TILT_MARS),
+    (TEX_JUPITER, R_JUPITER, ORB_JUPITER, +0.0),
+    (TEX_URANUS,  R_URANUS,  ORB_URANUS,  TILT_URANUS),
+    (TEX_NEPTUNE, R_NEPTUNE, ORB_NEPTUNE, TILT_NEPTUNE),
+]
+_BATCH_ORBITS = [orb for _tex, _r, orb, _tilt in PLANET_BATCH]
+_BATCH_RADII = np.array([r for _tex, r, _orb, _tilt in PLANET_BATCH],
+                        dtype=np.float32)
+# ANGLES slot of each batched planet's spin, in PLANET_BATCH order
+_BATCH_SPINS = [I_MERCURY_SPIN, I_VENUS_SPIN, I_MARS_SPIN,
+                I_JUPITER_SPIN, I_URANUS_SPIN, I_NEPTUNE_SPIN]
+
+# GLSL 1.20 function evaluating the fixed-function GL_LIGHT0 model (point
+# light, attenuation, colour material, non-local viewer) for an eye-space
+# position and normal; shared by the planet and Earth vertex shaders.
+LIGHT0_GLSL = """
+vec4 light0(vec4 ec_pos, vec3 n)
+{
+    vec3 l = gl_LightSource[0].position.xyz - ec_pos.xyz;
+    float d = length(l);
+    l /= d;
+    float att = 1.0 / (gl_LightSource[0].constantAttenuation
+                       + gl_LightSource[0].linearAttenuation * d
+                       + gl_LightSource[0].quadraticAttenuation * d * d);
+    float n_dot_l = max(dot(n, l), 0.0);
+
+    vec4 color = gl_FrontMaterial.emission + gl_LightModel.ambient * gl_Color
+               + att * (gl_LightSource[0].ambient * gl_Color
+                        + n_dot_l * gl_LightSource[0].diffuse * gl_Color);
+    if (n_dot_l > 0.0) {
+        vec3 h = normalize(l + vec3(0.0, 0.0, 1.0));
+        color += att * pow(max(dot(n, h), 0.0), gl_FrontMaterial.shininess)
+               * gl_FrontMaterial.specular * gl_LightSource[0].specular;
+    }
+    return vec4(clamp(color.rgb, 0.0, 1.0), gl_Color.a);
+}
+"""
+
+# GLSL 1.20 shaders for the batch.  The vertex shader applies the
+# per-instance model matrix and then evaluates the same per-vertex
+# lighting the fixed-function pipeline uses, so batched planets shade
+# like the ones drawn by draw_planet().
+PLANET_VERTEX_SHADER = """
+#version 120
+attribute mat4 model;
+attribute float layer;
+varying vec3 tex_coord;
+""" + LIGHT0_GLSL + """
+void main()
+{
+    vec4 ec_pos = gl_ModelViewMatrix * (model * gl_Vertex);
+    vec3 n = normalize(gl_NormalMatrix * (mat3(model) * gl_Normal));
+    gl_FrontColor = light0(ec_pos, n);
+
+    tex_coord = vec3(gl_MultiTexCoord0.st, layer);
+    gl_Position = gl_ProjectionMatrix * ec_pos;
+}
+"""
+
+PLANET_FRAGMENT_SHADER = """
+#version 120
+#extension GL_EXT_texture_array : require
+uniform sampler2DArray textures;
+varying vec3 tex_coord;
+void main()
+{
+    gl_FragColor = texture2DArray(textures, tex_coord) * gl_Color;
+}
+"""
+
+# Constant part of every instance matrix: the axial tilt (around Z),
+# stored transposed like orbit_frames
+_batch_tilt_t = np.array([_rot_z_t(tilt) for _tex, _r, _orb, tilt in PLANET_BATCH])
+
+# Per-frame scratch: scaled spin matrices and the (matrix, layer) records
+_batch_spin_t = np.tile(np.eye(+4, dtype=np.float32), (len(PLANET_BATCH), +1, +1))
+_batch_instances = np.zeros((len(PLANET_BATCH), +17), dtype=np.float32)
+_batch_instances[:, +16] = np.arange(len(PLANET_BATCH))
+
+
+def load_texture_array(filepaths):
+    """Upload same-sized opaque images as the layers of a mipmapped
+    GL_TEXTURE_2D_ARRAY.
+
+    Returns the texture name, or None if the images differ in size (the
+    caller then falls back to one GL_TEXTURE_2D per planet).
+    """
+    decoded = [_take_decoded((path, False, False)) for path in filepaths]
+    w, h = decoded[+0][:+2]
+    if any(img[:+2] != (w, h) for img in decoded):
+        return None
+
+    internal_fmt = (GL_COMPRESSED_RGB_S3TC_DXT1_EXT if s3tc_supported
+                    else GL_RGB8)
+    levels = int(math.log2(max(w, h))) + +1
+    tex_id = glGenTextures(+1)
+    glPixelStorei(GL_UNPACK_ALIGNMENT, +1)
+    glBindTexture(GL_TEXTURE_2D_ARRAY, tex_id)
+    if bool(glTexStorage3D):
+        glTexStorage3D(GL_TEXTURE_2D_ARRAY, levels, internal_fmt,
+                       w, h, len(decoded))
+    else:
+        glTexImage3D(GL_TEXTURE_2D_ARRAY, +0, internal_fmt, w, h,
+                     len(decoded), +0, GL_RGB, GL_UNSIGNED_BYTE, None)
+    for layer, (_w, _h, raw, gl_fmt, _fmt) in enumerate(decoded):
+        glTexSubImage3D(GL_TEXTURE_2D_ARRAY, +0, +0, +0, layer, w, h, +1,
+                        gl_fmt, GL_UNSIGNED_BYTE, raw)
+    glGenerateMipmap(GL_TEXTURE_2D_ARRAY)
+
+    glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_S, GL_REPEAT)
+    glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_T, GL_REPEAT)
+    glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MIN_FILTER,
+                    GL_LINEAR_MIPMAP_LINEAR)
+    if anisotropy > +1.0:
+        glTexParameterf(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAX_ANISOTROPY_EXT,
+                        anisotropy)
+    glBindTexture(GL_TEXTURE_2D_ARRAY, +0)
+    return tex_id
+
+
+def build_planet_batch():
+    """Set up the instanced planet pass: shaders, texture array and VAO.
+
+    Needs the shared sphere VAO, GL 3.3 instancing and texture arrays.
+    Returns False (leaving planet_program None) when any of them is
+    missing, in which case main() builds one textured sphere per planet.
+    """
+    global planet_program, planet_vao, planet_tex_array, planet_instance_vbo
+
+    if not (sphere_vao is not None and bool(glDrawElementsInstanced)
+            and bool(glVertexAttribDivisor) and bool(glTexSubImage3D)):
+        return False
+    try:
+        program = shaders.compileProgram(
+            shaders.compileShader(PLANET_VERTEX_SHADER, GL_VERTEX_SHADER),
+            shaders.compileShader(PLANET_FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+        )
+    except Exception as exc:
+        print("Planet shader unavailable, drawing planets one by one:", exc)
+        return False
+    tex_array = load_texture_array([tex for tex, _r, _o, _t in PLANET_BATCH])
+    if tex_array is None:
+        return False
+
+    glUseProgram(program)
+    glUniform1i(glGetUniformLocation(program, "textures"), +0)
+    glUseProgram(+0)
+    model_loc = glGetAttribLocation(program, "model")
+    layer_loc = glGetAttribLocation(program, "layer")
+
+    planet_instance_vbo = glGenBuffers(+1)
+    glBindBuffer(GL_ARRAY_BUFFER, planet_instance_vbo)
+    glBufferData(GL_ARRAY_BUFFER, _batch_instances.nbytes, None,
+                 GL_STREAM_DRAW)
+
+    # Sphere arrays per vertex; four matrix columns + layer per instance
+    planet_vao = glGenVertexArrays(+1)
+    glBindVertexArray(planet_vao)
+    stride = _batch_instances.shape[+1] * +4
+    for col in range(+4):
+        glEnableVertexAttribArray(model_loc + col)
+        glVertexAttribPointer(model_loc + col, +4, GL_FLOAT, GL_FALSE,
+                              stride, ctypes.c_void_p(col * +16))
+        glVertexAttribDivisor(model_loc + col, +1)
+    glEnableVertexAttribArray(layer_loc)
+    glVertexAttribPointer(layer_loc, +1, GL_FLOAT, GL_FALSE, stride,
+                          ctypes.c_void_p(+64))
+    glVertexAttribDivisor(layer_loc, +1)
+    glBindBuffer(GL_ARRAY_BUFFER, sphere_vbo)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, sphere_ibo)
+    _sphere_pointers()
+    glBindVertexArray(+0)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, +0)
+
+    planet_tex_array = tex_array
+    planet_program = program
+    return True
+
+
+def draw_planet_batch():
+    """Draw every planet in PLANET_BATCH with one glDrawElementsInstanced.
+
+    Each instance matrix is orbit * tilt * spin * scale(radius), built for
+    all planets at once in NumPy (transposed, i.e. column-major).
+    """
+    spins = ANGLES[_BATCH_SPINS].astype(np.float32)
+    c = np.cos(spins) * _BATCH_RADII
+    s = np.sin(spins) * _BATCH_RADII
+
+    # Transpose of Ry(spin) with the radius folded into its rows
+    m = _batch_spin_t
+    m[:, +0, +0] = c
+    m[:, +0, +2] = -s
+    m[:, +1, +1] = _BATCH_RADII
+    m[:, +2, +0] = s
+    m[:, +2, +2] = c
+
+    # (O * T * R * S)^T = (R * S)^T * T^T * O^T
+    model_t = m @ _batch_tilt_t @ orbit_frames[_BATCH_ORBITS]
+    _batch_instances[:, :+16] = model_t.reshape(len(PLANET_BATCH), +16)
+
+    # Only planets inside the view frustum become instances
+    instances = _batch_instances[body_visible[_BATCH_ORBITS]]
+    if len(instances) == +0:
+        return
+    glBindBuffer(GL_ARRAY_BUFFER, planet_instance_vbo)
+    glBufferSubData(GL_ARRAY_BUFFER, +0, instances.nbytes, instances)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
+
+    glColor3f(+1.0, +1.0, +1.0)
+    glUseProgram(planet_program)
+    glBindTexture(GL_TEXTURE_2D_ARRAY, planet_tex_array)
+    glBindVertexArray(planet_vao)
+    glDrawElementsInstanced(GL_TRIANGLES, sphere_index_count,
+                            sphere_index_type, ctypes.c_void_p(+0),
+                            len(instances))
+    glBindVertexArray(+0)
+    glBindTexture(GL_TEXTURE_2D_ARRAY, +0)
+    glUseProgram(+0)
 
 
 # ===================================================================
 #  Earth special rendering (day + night + clouds)
 # ===================================================================
 
+# Constant axial tilt shared by the Earth and cloud spheres (column-major)
+_TILT_EARTH_T = _rot_z_t(TILT_EARTH)
+
+# Overall opacity of the cloud layer (scales the per-pixel cloud alpha)
+CLOUD_ALPHA = +0.75
+
+# GLSL 1.20 shaders fusing the three Earth layers into one sphere draw:
+# the lit day map, the additive night lights and the cloud map blended
+# on top.  Clouds spin at their own rate, which on the shared sphere is
+# just a horizontal texture offset (cloud_offset, in turns).
+EARTH_VERTEX_SHADER = """
+#version 120
+""" + LIGHT0_GLSL + """
+void main()
+{
+    vec4 ec_pos = gl_ModelViewMatrix * gl_Vertex;
+    gl_FrontColor = light0(ec_pos, normalize(gl_NormalMatrix * gl_Normal));
+    gl_TexCoord[0] = gl_MultiTexCoord0;
+    gl_Position = gl_ProjectionMatrix * ec_pos;
+}
+"""
+
+EARTH_FRAGMENT_SHADER = """
+#version 120
+uniform sampler2D day_map;
+uniform sampler2D night_map;
+uniform sampler2D cloud_map;
+uniform float cloud_offset;
+uniform float cloud_alpha;
+void main()
+{
+    vec2 uv = gl_TexCoord[0].st;
+    vec3 surface = texture2D(day_map, uv).rgb * gl_Color.rgb
+                 + texture2D(night_map, uv).rgb;
+    vec4 cloud = texture2D(cloud_map, uv + vec2(cloud_offset, 0.0));
+    gl_FragColor = vec4(mix(min(surface, 1.0), cloud.rgb * gl_Color.rgb,
+                            cloud.a * cloud_alpha), 1.0);
+}
+"""
+
+
+def build_earth_program():
+    """Compile the fused Earth shader; on failure earth_program stays None
+    and draw_earth() falls back to one sphere pass per layer."""
+    global earth_program, earth_cloud_offset_loc
+
+    try:
+        program = shaders.compileProgram(
+            shaders.compileShader(EARTH_VERTEX_SHADER, GL_VERTEX_SHADER),
+            shaders.compileShader(EARTH_FRAGMENT_SHADER, GL_FRAGMENT_SHADER),
+        )
+    except Exception as exc:
+        print("Earth shader unavailable, drawing one pass per layer:", exc)
+        return
+    glUseProgram(program)
+    glUniform1i(glGetUniformLocation(program, "day_map"), +0)
+    glUniform1i(glGetUniformLocation(program, "night_map"), +1)
+    glUniform1i(glGetUniformLocation(program, "cloud_map"), +2)
+    glUniform1f(glGetUniformLocation(program, "cloud_alpha"), CLOUD_ALPHA)
+    glUseProgram(+0)
+
+    earth_cloud_offset_loc = glGetUniformLocation(program, "cloud_offset")
+    earth_program = program
+
+
 def draw_earth():
     """Draw Earth with three layers:
 
     1. **Day texture** -- lit normally by GL_LIGHT0.
-    2. **Night texture** -- blended on top with additive blending so city
-       lights glow on the dark hemisphere (the lighting naturally dims the
-       day texture on the dark side, letting the night layer show through).
-    3. **Cloud layer** -- a slightly larger, semi-transparent sphere that
-       rotates at a different speed, giving the illusion of weather.
+    2. **Night texture** -- added on top so city lights glow on the dark
+       hemisphere (the lighting naturally dims the day texture on the
+       dark side, letting the night layer show through).
+    3. **Cloud layer** -- a semi-transparent map that rotates at a
+       different speed, giving the illusion of weather.
+
+    With earth_program all three come from one shaded sphere draw;
+    otherwise each layer is its own pass (see _draw_earth_layers).
     """
     glPushMatrix()
 
-    # -- Tilt orbital plane to true inclination --------------------------
-    glRotatef(math.degrees(NODE_EARTH), +0.0, +1.0, +0.0)
-    glRotatef(math.degrees(INCL_EARTH), +1.0, +0.0, +0.0)
+    # -- Move to Earth's orbital position on its inclined plane ----------
+    glMultMatrixf(orbit_frames[ORB_EARTH])
 
-    # -- Move to Earth's orbital position --------------------------------
-    glRotatef(math.degrees(angle_earth_orb), +0.0, +1.0, +0.0)
-    glTranslatef(D_EARTH, +0.0, +0.0)
+    if not body_visible[ORB_EARTH]:
+        pass   # outside the view frustum; the Moon is tested separately
+    elif earth_program is not None:
+        glPushMatrix()
+        # Axial tilt + spin
+        glMultMatrixf(_rot_y_t(ANGLES[I_EARTH_SPIN]) @ _TILT_EARTH_T)
+        glScalef(R_EARTH, R_EARTH, R_EARTH)
+        glColor3f(+1.0, +1.0, +1.0)
+
+        # A body rotated by a shows texture column u at angle 2*pi*u + a,
+        # so the clouds sit (earth - cloud) / 2*pi turns along u
+        glUseProgram(earth_program)
+        glUniform1f(earth_cloud_offset_loc,
+                    (ANGLES[I_EARTH_SPIN] - ANGLES[I_CLOUD_SPIN]) / TWO_PI)
+        for unit, sphere in ((+2, sph_earth_cloud), (+1, sph_earth_night),
+                             (+0, sph_earth_day)):
+            glActiveTexture(GL_TEXTURE0 + unit)
+            glBindTexture(GL_TEXTURE_2D, sphere[+0])
+        draw_unit_sphere()
+        for unit in (+2, +1, +0):
+            glActiveTexture(GL_TEXTURE0 + unit)
+            glBindTexture(GL_TEXTURE_2D, +0)
+        glUseProgram(+0)
+        glPopMatrix()
+    else:
+        _draw_earth_layers()
 
-    # -- Save orbital position for the Moon later ------------------------
-    glPushMatrix()
+    # -- Moon ------------------------------------------------------------
+    if body_visible[ORB_MOON]:
+        draw_moon()
 
+    glPopMatrix()
+
+
+def _draw_earth_layers():
+    """Fixed-function fallback: day, night and cloud spheres drawn in turn
+    (called at Earth's orbital position)."""
     # -- Axial tilt + spin -----------------------------------------------
-    glRotatef(math.degrees(TILT_EARTH), +0.0, +0.0, +1.0)
-    glRotatef(math.degrees(angle_earth_spin), +0.0, +1.0, +0.0)
+    glPushMatrix()
+    glMultMatrixf(_rot_y_t(ANGLES[I_EARTH_SPIN]) @ _TILT_EARTH_T)
 
     glColor3f(+1.0, +1.0, +1.0)
 
     # Layer 1: Day-side texture (standard lit rendering)
     glEnable(GL_LIGHTING)
-    glCallList(dl_earth_day)
+    draw_sphere(sph_earth_day)
 
     # Layer 2: Night-side city lights (additive blend)
     # Where diffuse lighting is low (dark side), the additive
@@ -753,7 +1851,7 @@ def draw_earth():
     glBlendFunc(GL_ONE, GL_ONE)
     glDisable(GL_LIGHTING)
     glDepthFunc(GL_LEQUAL)
-    glCallList(dl_earth_night)
+    draw_sphere(sph_earth_night)
     glDepthFunc(GL_LESS)
     glDisable(GL_BLEND)
     glEnable(GL_LIGHTING)
@@ -763,26 +1861,20 @@ def draw_earth():
     # Layer 3: Clouds -- slightly larger sphere, semi-transparent,
     # own rotation speed
     glPushMatrix()
-    glRotatef(math.degrees(TILT_EARTH), +0.0, +0.0, +1.0)
-    glRotatef(math.degrees(angle_cloud_spin), +0.0, +1.0, +0.0)
+    glMultMatrixf(_rot_y_t(ANGLES[I_CLOUD_SPIN]) @ _TILT_EARTH_T)
 
     glEnable(GL_BLEND)
     glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
     # Per-pixel alpha (from luminance) makes clouds opaque and clear sky
     # transparent.  Vertex alpha provides an overall softness multiplier.
-    glColor4f(+1.0, +1.0, +1.0, +0.75)
+    glColor4f(+1.0, +1.0, +1.0, CLOUD_ALPHA)
     glDepthMask(GL_FALSE)
-    glCallList(dl_earth_cloud)
+    draw_sphere(sph_earth_cloud)
     glDepthMask(GL_TRUE)
     glDisable(GL_BLEND)
 
     glPopMatrix()
 
-    # -- Moon ------------------------------------------------------------
-    draw_moon()
-
-    glPopMatrix()
-
 
 def draw_moon():
     """Draw the Moon orbiting Earth with tidal locking.
@@ -791,19 +1883,12 @@ def draw_moon():
     """
     glPushMatrix()
 
-    # Tilt the Moon's orbital plane (inclined ~5.1 deg to the ecliptic)
-    glRotatef(math.degrees(NODE_MOON), +0.0, +1.0, +0.0)
-    glRotatef(math.degrees(INCL_MOON), +1.0, +0.0, +0.0)
-
-    # Orbit around Earth (local Y)
-    glRotatef(math.degrees(angle_moon_orb), +0.0, +1.0, +0.0)
-    glTranslatef(D_MOON, +0.0, +0.0)
-
-    # Tidal lock: cancel the orbital rotation on the body itself
-    glRotatef(-math.degrees(angle_moon_orb), +0.0, +1.0, +0.0)
+    # Orbit around Earth (local Y) on a plane inclined ~5.1 deg to the
+    # ecliptic; tidal lock cancels the orbital rotation on the body itself
+    glMultMatrixf(_rot_y_t(-ANGLES[I_MOON_ORB]) @ orbit_frames[ORB_MOON])
 
     glColor3f(+1.0, +1.0, +1.0)
-    glCallList(dl_moon)
+    draw_sphere(sph_moon)
 
     glPopMatrix()
 
@@ -812,41 +1897,36 @@ def draw_moon():
 #  Saturn special rendering (planet + ring)
 # ===================================================================
 
+# Constant axial tilt shared by the planet body and ring (column-major)
+_TILT_SATURN_T = _rot_z_t(TILT_SATURN)
+
 def draw_saturn():
-    """Draw Saturn with its tilted ring system.
+    """Draw Saturn's (opaque) body; the ring follows in draw_saturn_ring().
 
-    The ring sits in Saturn's equatorial plane and rotates at its own
-    mean Keplerian angular velocity (different from the planet's surface
-    spin).  Inner ring particles orbit faster, outer ones slower; we use
-    a single intermediate rate as a visual approximation.
+    Orbit on the inclined orbital plane, then the axial tilt shared by
+    planet body and ring, then the body's self-spin.
     """
     glPushMatrix()
-
-    # Tilt the orbital plane to true inclination
-    glRotatef(math.degrees(NODE_SATURN), +0.0, +1.0, +0.0)
-    glRotatef(math.degrees(INCL_SATURN), +1.0, +0.0, +0.0)
-
-    # Orbit
-    glRotatef(math.degrees(angle_saturn_orb), +0.0, +1.0, +0.0)
-    glTranslatef(D_SATURN, +0.0, +0.0)
-
-    # Axial tilt (shared by planet body and ring)
-    glRotatef(math.degrees(TILT_SATURN), +0.0, +0.0, +1.0)
-
-    # Self-spin (planet body)
-    glPushMatrix()
-    glRotatef(math.degrees(angle_saturn_spin), +0.0, +1.0, +0.0)
+    glMultMatrixf(_rot_y_t(ANGLES[I_SATURN_SPIN]) @ _TILT_SATURN_T
+                  @ orbit_frames[ORB_SATURN])
     glColor3f(+1.0, +1.0, +1.0)
-    glCallList(dl_saturn)
+    draw_sphere(sph_saturn)
     glPopMatrix()
 
-    # Ring -- rotates at its own mean Keplerian rate in the equatorial plane
+
+def draw_saturn_ring():
+    """Draw Saturn's tilted ring (in display()'s blended phase).
+
+    The ring sits in Saturn's equatorial plane and rotates at its own
+    mean Keplerian angular velocity (different from the planet's surface
+    spin).  Inner ring particles orbit faster, outer ones slower; we use
+    a single intermediate rate as a visual approximation.
+    """
     glPushMatrix()
-    glRotatef(math.degrees(angle_saturn_ring), +0.0, +1.0, +0.0)
+    glMultMatrixf(_rot_y_t(ANGLES[I_SATURN_RING]) @ _TILT_SATURN_T
+                  @ orbit_frames[ORB_SATURN])
     glColor4f(+1.0, +1.0, +1.0, +0.85)
-    glCallList(dl_saturn_ring)
-    glPopMatrix()
-
+    draw_ring(ring_saturn)
     glPopMatrix()
 
 
@@ -856,6 +1936,12 @@ def draw_saturn():
 
 def init_gl():
     """One-time GL state: background colour, depth test, projection."""
+    global s3tc_supported, anisotropy
+    s3tc_supported = bool(glInitTextureCompressionS3TcEXT())
+    if glInitTextureFilterAnisotropicEXT():
+        anisotropy = min(MAX_ANISOTROPY,
+                         float(glGetFloatv(GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT)))
+
     glClearColor(+0.0, +0.0, +0.0, +0.0)
     glClearDepth(+1.0)
     glDepthFunc(GL_LESS)
@@ -863,16 +1949,25 @@ def init_gl():
     glDisable(GL_CULL_FACE)
 
     glShadeModel(GL_SMOOTH)
+    # No-op when the window has no multisample buffer
+    glEnable(GL_MULTISAMPLE)
+    # Spheres are unit meshes scaled in the modelview matrix; rescale the
+    # normals back to unit length so lighting is unaffected by the scale
+    glEnable(GL_RESCALE_NORMAL)
     glHint(GL_PERSPECTIVE_CORRECTION_HINT, GL_NICEST)
 
     # Point size for starfield
     glPointSize(+1.8)
     glEnable(GL_POINT_SMOOTH)
 
+    # Sun light and default material (fixed for the whole run)
+    setup_lighting()
+
     # Initial projection
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
     gluPerspective(FOV_Y, WINDOW_W / float(WINDOW_H), NEAR_PLANE, FAR_PLANE)
+    capture_projection()
     glMatrixMode(GL_MODELVIEW)
 
 
@@ -884,6 +1979,7 @@ def reshape(w, h):
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
     gluPerspective(FOV_Y, w / float(h), NEAR_PLANE, FAR_PLANE)
+    capture_projection()
     glMatrixMode(GL_MODELVIEW)
 
 
@@ -894,19 +1990,9 @@ def reshape(w, h):
 def update_angles():
     """Advance every angle based on real elapsed time."""
     global last_time
-    global angle_sun_spin
-    global angle_mercury_orb, angle_mercury_spin
-    global angle_venus_orb, angle_venus_spin
-    global angle_earth_orb, angle_earth_spin, angle_cloud_spin
-    global angle_moon_orb
-    global angle_mars_orb, angle_mars_spin
-    global angle_jupiter_orb, angle_jupiter_spin
-    global angle_saturn_orb, angle_saturn_spin, angle_saturn_ring
-    global angle_uranus_orb, angle_uranus_spin
-    global angle_neptune_orb, angle_neptune_spin
     global cam_yaw, cam_pitch, cam_dist
 
-    now = glutGet(GLUT_ELAPSED_TIME) / +1000.0  # seconds
+    now = time.perf_counter()  # seconds
     if last_time is None:
         last_time = now
     dt = now - last_time
@@ -917,47 +2003,8 @@ def update_angles():
     if paused:
         dt = +0.0
 
-    TWO_PI = +2.0 * math.pi
-
-    # Sun
-    angle_sun_spin = (angle_sun_spin + W_SUN_SPIN * dt) % TWO_PI
-
-    # Mercury
-    angle_mercury_orb  = (angle_mercury_orb  + W_MERCURY_ORBIT * dt) % TWO_PI
-    angle_mercury_spin = (angle_mercury_spin  + W_MERCURY_SPIN  * dt) % TWO_PI
-
-    # Venus
-    angle_venus_orb  = (angle_venus_orb  + W_VENUS_ORBIT * dt) % TWO_PI
-    angle_venus_spin = (angle_venus_spin  + W_VENUS_SPIN  * dt) % TWO_PI
-
-    # Earth + clouds
-    angle_earth_orb  = (angle_earth_orb  + W_EARTH_ORBIT * dt) % TWO_PI
-    angle_earth_spin = (angle_earth_spin  + W_EARTH_SPIN  * dt) % TWO_PI
-    angle_cloud_spin = (angle_cloud_spin  + W_CLOUD_SPIN  * dt) % TWO_PI
-
-    # Moon
-    angle_moon_orb = (angle_moon_orb + W_MOON_ORBIT * dt) % TWO_PI
-
-    # Mars
-    angle_mars_orb  = (angle_mars_orb  + W_MARS_ORBIT * dt) % TWO_PI
-    angle_mars_spin = (angle_mars_spin  + W_MARS_SPIN  * dt) % TWO_PI
-
-    # Jupiter
-    angle_jupiter_orb  = (angle_jupiter_orb  + W_JUPITER_ORBIT * dt) % TWO_PI
-    angle_jupiter_spin = (angle_jupiter_spin  + W_JUPITER_SPIN  * dt) % TWO_PI
-
-    # Saturn
-    angle_saturn_orb  = (angle_saturn_orb  + W_SATURN_ORBIT     * dt) % TWO_PI
-    angle_saturn_spin = (angle_saturn_spin + W_SATURN_SPIN      * dt) % TWO_PI
-    angle_saturn_ring = (angle_saturn_ring + W_SATURN_RING_SPIN * dt) % TWO_PI
-
-    # Uranus
-    angle_uranus_orb  = (angle_uranus_orb  + W_URANUS_ORBIT * dt) % TWO_PI
-    angle_uranus_spin = (angle_uranus_spin  + W_URANUS_SPIN  * dt) % TWO_PI
-
-    # Neptune
-    angle_neptune_orb  = (angle_neptune_orb  + W_NEPTUNE_ORBIT * dt) % TWO_PI
-    angle_neptune_spin = (angle_neptune_spin  + W_NEPTUNE_SPIN  * dt) % TWO_PI
+    # Advance every orbit and spin at once, wrapped to [0, TWO_PI)
+    ANGLES[:] = (ANGLES + OMEGAS * dt) % TWO_PI
 
     # -- Smooth camera controls (always active, even when paused) --------
     if GLUT_KEY_LEFT in keys_held:
@@ -965,9 +2012,9 @@ def update_angles():
     if GLUT_KEY_RIGHT in keys_held:
         cam_yaw += CAM_YAW_SPEED * cam_dt
     if GLUT_KEY_UP in keys_held:
-        cam_pitch = min(cam_pitch + CAM_PITCH_SPEED * cam_dt, math.pi / +2.0 - +0.05)
+        cam_pitch = min(cam_pitch + CAM_PITCH_SPEED * cam_dt, CAM_PITCH_LIMIT)
     if GLUT_KEY_DOWN in keys_held:
-        cam_pitch = max(cam_pitch - CAM_PITCH_SPEED * cam_dt, -math.pi / +2.0 + +0.05)
+        cam_pitch = max(cam_pitch - CAM_PITCH_SPEED * cam_dt, -CAM_PITCH_LIMIT)
     if ord('+') in keys_held or ord('=') in keys_held:
         cam_dist = min(cam_dist + CAM_ZOOM_SPEED * cam_dt, CAM_MIN_DIST)
     if ord('-') in keys_held:
@@ -978,12 +2025,105 @@ def update_angles():
 #  HUD text overlay
 # ===================================================================
 
+HUD_FONT_SIZE = +18    # pixels, close to GLUT_BITMAP_HELVETICA_18
+
+
+def build_hud_font():
+    """Rasterise printable ASCII into one alpha texture with PIL.
+
+    Glyphs sit in a 16 x 6 grid of equal cells; each row of *hud_glyphs*
+    holds a glyph's texture rectangle and its pen advance.  Needs a
+    FreeType font from PIL (Pillow >= 10.1); otherwise hud_font_tex stays
+    None and draw_hud_text() falls back to glutBitmapCharacter.
+    """
+    global hud_font_tex, hud_glyphs, hud_metrics
+
+    try:
+        font = ImageFont.load_default(size=HUD_FONT_SIZE)
+    except TypeError:
+        font = None
+    if not isinstance(font, ImageFont.FreeTypeFont):
+        print("No scalable HUD font, drawing text with GLUT bitmaps")
+        return
+
+    chars = [chr(c) for c in range(+32, +127)]
+    ascent, descent = font.getmetrics()
+    advances = [round(font.getlength(ch)) for ch in chars]
+    cell_w = max(font.getbbox(ch)[+2] for ch in chars) + +1
+    cell_h = ascent + descent
+    cols, rows = +16, (len(chars) + +15) // +16
+    atlas = Image.new("L", (cols * cell_w, rows * cell_h))
+    draw = ImageDraw.Draw(atlas)
+    glyphs = np.empty((len(chars), +5), dtype=np.float32)
+    for i, ch in enumerate(chars):
+        col, row = i % cols, i // cols
+        draw.text((col * cell_w, row * cell_h + ascent), ch, font=font,
+                  fill=+255, anchor="ls")
+        # Rows are flipped for OpenGL below, so v runs bottom-up
+        glyphs[i] = (col / float(cols), +1.0 - (row + +1) / float(rows),
+                     (col + +1) / float(cols), +1.0 - row / float(rows),
+                     advances[i])
+
+    pixels = np.asarray(atlas)[::-1].copy()
+    tex_id = glGenTextures(+1)
+    glPixelStorei(GL_UNPACK_ALIGNMENT, +1)
+    glBindTexture(GL_TEXTURE_2D, tex_id)
+    glTexImage2D(GL_TEXTURE_2D, +0, GL_ALPHA, atlas.width, atlas.height, +0,
+                 GL_ALPHA, GL_UNSIGNED_BYTE, pixels)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+    glBindTexture(GL_TEXTURE_2D, +0)
+
+    hud_glyphs = glyphs
+    hud_metrics = (cell_w, ascent, descent)
+    hud_font_tex = tex_id
+
+
+def _hud_text_vbo(text):
+    """Return the cached (vbo, vertex count) of *text*'s glyph quads.
+
+    Quads are GL_T2F_V3F, laid out from a pen at the origin on the
+    baseline; a string is uploaded once, the first time it is drawn.
+    """
+    cached = _hud_cache.get(text)
+    if cached is not None:
+        return cached
+
+    # Non-printable characters fall back to the space glyph
+    codes = np.frombuffer(text.encode("ascii", "replace"), dtype=np.uint8)
+    codes = np.clip(codes.astype(np.intp) - +32, +0, len(hud_glyphs) - +1)
+    u0, v0, u1, v1, advance = hud_glyphs[codes].T
+    pen = np.concatenate(([+0.0], np.cumsum(advance[:-1])))
+    cell_w, ascent, descent = hud_metrics
+
+    quads = np.zeros((len(codes), +4, +5), dtype=np.float32)
+    quads[:, :, +0] = np.stack((u0, u1, u1, u0), axis=+1)
+    quads[:, :, +1] = np.stack((v0, v0, v1, v1), axis=+1)
+    quads[:, :, +2] = pen[:, None] + np.array([+0, cell_w, cell_w, +0])
+    quads[:, :, +3] = np.array([-descent, -descent, ascent, ascent])
+
+    vbo = glGenBuffers(+1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, quads.nbytes, quads, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, +0)
+
+    cached = _hud_cache[text] = (vbo, len(codes) * +4)
+    return cached
+
+
 def draw_hud_text(text, x, y):
-    """Draw *text* as a bitmap string at screen position (*x*, *y*) pixels.
+    """Draw *text* at screen position (*x*, *y*) pixels (baseline start).
 
     Uses an orthographic overlay so coordinates are in window pixels.
-    (0, 0) is the bottom-left corner.
+    (0, 0) is the bottom-left corner.  With the glyph atlas the string is
+    one cached VBO and one glDrawArrays; otherwise it goes character by
+    character through glutBitmapCharacter.
     """
+    if not text:
+        return
+
     glMatrixMode(GL_PROJECTION)
     glPushMatrix()
     glLoadIdentity()
@@ -998,9 +2138,26 @@ def draw_hud_text(text, x, y):
     glDisable(GL_DEPTH_TEST)
     glColor3f(+1.0, +1.0, +1.0)
 
-    glRasterPos2f(x, y)
-    for ch in text:
-        glutBitmapCharacter(_FONT, ord(ch))
+    if hud_font_tex is not None:
+        vbo, count = _hud_text_vbo(text)
+        glTranslatef(x, y, +0.0)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, hud_font_tex)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glInterleavedArrays(GL_T2F_V3F, +0, ctypes.c_void_p(+0))
+        glDrawArrays(GL_QUADS, +0, count)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, +0)
+        glDisable(GL_BLEND)
+        glBindTexture(GL_TEXTURE_2D, +0)
+        glDisable(GL_TEXTURE_2D)
+    else:
+        glRasterPos2f(x, y)
+        for ch in text:
+            glutBitmapCharacter(_FONT, ord(ch))
 
     glEnable(GL_DEPTH_TEST)
     glPopMatrix()
@@ -1016,103 +2173,84 @@ def draw_hud_text(text, x, y):
 def display():
     """Main render loop: clear, set camera, draw everything, swap."""
     update_angles()
+    update_orbit_frames()
 
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
     glMatrixMode(GL_MODELVIEW)
-    glLoadIdentity()
 
-    # -- Camera transform ------------------------------------------------
-    glTranslatef(+0.0, +0.0, cam_dist)
-    glRotatef(math.degrees(cam_pitch), +1.0, +0.0, +0.0)
-    glRotatef(math.degrees(cam_yaw),   +0.0, +1.0, +0.0)
+    # -- Camera transform: T(0, 0, dist) * Rx(pitch) * Ry(yaw) -----------
+    # The rotations have no translation part, so the dolly only lands in
+    # the Z slot of the (column-major) translation row.
+    view = _rot_y_t(cam_yaw) @ _rot_x_t(cam_pitch)
+    view[+3, +2] = cam_dist
+    glLoadMatrixf(view)
+    update_visibility(view)
 
     # -- Milky Way backdrop (furthest layer, no lighting) ----------------
-    glDisable(GL_LIGHTING)
-    glDisable(GL_DEPTH_TEST)
-    glColor3f(+1.0, +1.0, +1.0)
-    glCallList(dl_milky_way)
-    glEnable(GL_DEPTH_TEST)
+    draw_sky()
 
     # -- Starfield (twinkling points on top of the backdrop) --------------
-    t = glutGet(GLUT_ELAPSED_TIME) / +1000.0
+    t = time.perf_counter()
     draw_starfield(t)
 
-    # -- Orbit trails (no lighting) --------------------------------------
-    draw_all_orbits()
-
-    # -- Lighting (Sun is at origin) -------------------------------------
+    # ===== Opaque, lit phase ============================================
+    # GL_POSITION is transformed by the current modelview, so the Sun's
+    # world-space position is re-sent after every camera change
     glEnable(GL_LIGHTING)
-    setup_lighting()
+    glLightfv(GL_LIGHT0, GL_POSITION, _LIGHT_POSITION)
 
     # -- Sun (emissive -- not affected by its own light) -----------------
     glPushMatrix()
-    glMaterialfv(GL_FRONT, GL_EMISSION, [+1.0, +0.95, +0.8, +1.0])
-    glRotatef(math.degrees(angle_sun_spin), +0.0, +1.0, +0.0)
+    glMaterialfv(GL_FRONT, GL_EMISSION, _SUN_EMIT_ON)
+    glMultMatrixf(_rot_y_t(ANGLES[I_SUN_SPIN]))
     glColor3f(+1.0, +1.0, +1.0)
-    glCallList(dl_sun)
-    glMaterialfv(GL_FRONT, GL_EMISSION, [+0.0, +0.0, +0.0, +1.0])
+    draw_sphere(sph_sun)
+    glMaterialfv(GL_FRONT, GL_EMISSION, _SUN_EMIT_OFF)
     glPopMatrix()
 
-    # -- Sun glow / corona (additive semi-transparent layers) -----------
-    glDisable(GL_LIGHTING)
-    glDisable(GL_TEXTURE_2D)
-    glEnable(GL_BLEND)
-    glBlendFunc(GL_SRC_ALPHA, GL_ONE)
-    glDepthMask(GL_FALSE)
-
-    glow_layers = [
-        (R_SUN * +1.12, +1.0,  +0.85, +0.4,  +0.12),
-        (R_SUN * +1.28, +1.0,  +0.7,  +0.2,  +0.06),
-        (R_SUN * +1.50, +0.9,  +0.5,  +0.15, +0.03),
-    ]
-    for scale, gr, gg, gb, ga in glow_layers:
-        glPushMatrix()
-        glScalef(scale, scale, scale)
-        glColor4f(gr, gg, gb, ga)
-        glCallList(dl_glow)
-        glPopMatrix()
-
-    glDepthMask(GL_TRUE)
-    glDisable(GL_BLEND)
-    glEnable(GL_LIGHTING)
-
-    # -- Mercury ---------------------------------------------------------
-    draw_planet(angle_mercury_orb, D_MERCURY, angle_mercury_spin,
-                +0.0, dl_mercury,
-                incl_rad=INCL_MERCURY, node_rad=NODE_MERCURY)
-
-    # -- Venus -----------------------------------------------------------
-    draw_planet(angle_venus_orb, D_VENUS, angle_venus_spin,
-                +0.0, dl_venus,
-                incl_rad=INCL_VENUS, node_rad=NODE_VENUS)
+    # -- Mercury, Venus, Mars, Jupiter, Uranus, Neptune ------------------
+    if planet_program is not None:
+        draw_planet_batch()
+    else:
+        # Uranus has an extreme axial tilt (~98 deg)
+        for orb, spin, tilt, sphere in (
+                (ORB_MERCURY, I_MERCURY_SPIN, +0.0,         sph_mercury),
+                (ORB_VENUS,   I_VENUS_SPIN,   +0.0,         sph_venus),
+                (ORB_MARS,    I_MARS_SPIN,    TILT_MARS,    sph_mars),
+                (ORB_JUPITER, I_JUPITER_SPIN, +0.0,         sph_jupiter),
+                (ORB_URANUS,  I_URANUS_SPIN,  TILT_URANUS,  sph_uranus),
+                (ORB_NEPTUNE, I_NEPTUNE_SPIN, TILT_NEPTUNE, sph_neptune)):
+            if body_visible[orb]:
+                draw_planet(orbit_frames[orb], ANGLES[spin], tilt, sphere)
 
     # -- Earth (custom renderer for day/night/clouds/moon) ---------------
     draw_earth()
 
-    # -- Mars ------------------------------------------------------------
-    draw_planet(angle_mars_orb, D_MARS, angle_mars_spin,
-                TILT_MARS, dl_mars,
-                incl_rad=INCL_MARS, node_rad=NODE_MARS)
+    # -- Saturn body -----------------------------------------------------
+    if body_visible[ORB_SATURN]:
+        draw_saturn()
 
-    # -- Jupiter ---------------------------------------------------------
-    draw_planet(angle_jupiter_orb, D_JUPITER, angle_jupiter_spin,
-                +0.0, dl_jupiter,
-                incl_rad=INCL_JUPITER, node_rad=NODE_JUPITER)
+    # ===== Blended phase: state set once, depth writes off ==============
+    # Everything opaque is in the depth buffer, so each blended layer is
+    # still hidden behind the planets it passes behind.
+    glEnable(GL_BLEND)
+    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    glDepthMask(GL_FALSE)
 
-    # -- Saturn (custom renderer for ring) -------------------------------
-    draw_saturn()
+    # -- Saturn ring (lit, alpha-blended) --------------------------------
+    if body_visible[ORB_SATURN]:
+        draw_saturn_ring()
 
-    # -- Uranus (extreme axial tilt ~98 deg) ----------------------------
-    draw_planet(angle_uranus_orb, D_URANUS, angle_uranus_spin,
-                TILT_URANUS, dl_uranus,
-                incl_rad=INCL_URANUS, node_rad=NODE_URANUS)
+    glDisable(GL_LIGHTING)
 
-    # -- Neptune ---------------------------------------------------------
-    draw_planet(angle_neptune_orb, D_NEPTUNE, angle_neptune_spin,
-                TILT_NEPTUNE, dl_neptune,
-                incl_rad=INCL_NEPTUNE, node_rad=NODE_NEPTUNE)
+    # -- Orbit trails (unlit, alpha-blended) -----------------------------
+    draw_all_orbits()
 
-    glDisable(GL_LIGHTING)
+    # -- Sun glow / corona (unlit, additive) -----------------------------
+    draw_glow()
+
+    glDepthMask(GL_TRUE)
+    glDisable(GL_BLEND)
 
     # -- HUD overlay (pause indicator) ----------------------------------
     if paused:
@@ -1122,12 +2260,30 @@ def display():
 
 
 # ===================================================================
-#  Callbacks: keyboard + idle
+#  Callbacks: keyboard + timer + visibility
 # ===================================================================
 
-def idle():
-    """Request continuous redisplay for smooth animation."""
+def timer(_value):
+    """Request a redisplay and re-arm the timer (~60 Hz, not a busy loop).
+
+    While the window is hidden or minimised nothing would reach the
+    screen, so the timer lapses instead; visibility() restarts it.
+    """
+    global timer_armed
+    if not window_visible:
+        timer_armed = False
+        return
     glutPostRedisplay()
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, +0)
+
+
+def visibility(state):
+    """Pause redraws while hidden and restart the timer when shown again."""
+    global window_visible, timer_armed
+    window_visible = state == GLUT_VISIBLE
+    if window_visible and not timer_armed:
+        timer_armed = True
+        glutTimerFunc(FRAME_INTERVAL_MS, timer, +0)
 
 
 def special_key_down(key, _x, _y):
@@ -1179,14 +2335,20 @@ def normal_key_up(key, _x, _y):
 # ===================================================================
 
 def main():
-    global dl_sun, dl_mercury, dl_venus
-    global dl_earth_day, dl_earth_night, dl_earth_cloud, dl_moon
-    global dl_mars, dl_jupiter, dl_saturn, dl_saturn_ring
-    global dl_uranus, dl_neptune, dl_glow, dl_milky_way
+    global sph_sun, sph_mercury, sph_venus
+    global sph_earth_day, sph_earth_night, sph_earth_cloud, sph_moon
+    global sph_mars, sph_jupiter, sph_saturn, ring_saturn
+    global sph_uranus, sph_neptune, sph_milky_way
+    global timer_armed
 
     # -- GLUT setup ------------------------------------------------------
     glutInit(sys.argv)
-    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGBA | GLUT_DEPTH)
+    # Multisampling smooths planet silhouettes at native resolution
+    try:
+        glutSetOption(GLUT_MULTISAMPLE, MSAA_SAMPLES)
+    except Exception:
+        pass  # not all GLUT builds support this option
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGBA | GLUT_DEPTH | GLUT_MULTISAMPLE)
     glutInitWindowPosition(+50, +50)
     glutInitWindowSize(WINDOW_W, WINDOW_H)
     glutCreateWindow(b"Solar System | Arrows=orbit  +/-=zoom  Space=pause  H=reset  Esc=quit")
@@ -1201,38 +2363,62 @@ def main():
     # -- GL state --------------------------------------------------------
     init_gl()
 
-    # -- Build display lists for each body -------------------------------
+    # -- Shared sphere mesh + textures / ring VBO for each body ----------
+    build_unit_sphere_vbo(SPHERE_SLICES, SPHERE_STACKS)
+    build_quad_vbo()
+    build_glow()
+    build_earth_program()
+    build_sky_program()
+    build_hud_font()
     print("Loading textures...")
-    dl_sun     = build_sphere_list(TEX_SUN,     R_SUN)
-    dl_mercury = build_sphere_list(TEX_MERCURY, R_MERCURY)
-    dl_venus   = build_sphere_list(TEX_VENUS,   R_VENUS)
-    dl_earth_day   = build_sphere_list(TEX_EARTH_DAY,    R_EARTH)
-    dl_earth_night = build_sphere_list(TEX_EARTH_NIGHT,  R_EARTH)
-    dl_earth_cloud = build_sphere_list(TEX_EARTH_CLOUDS, R_EARTH * +1.015,
-                                        alpha_from_luminance=True)
-    dl_moon    = build_sphere_list(TEX_MOON,    R_MOON)
-    dl_mars    = build_sphere_list(TEX_MARS,    R_MARS)
-    dl_jupiter = build_sphere_list(TEX_JUPITER, R_JUPITER)
-    dl_saturn  = build_sphere_list(TEX_SATURN,  R_SATURN)
-    dl_saturn_ring = build_ring_list(TEX_SATURN_RING,
-                                     SATURN_RING_INNER, SATURN_RING_OUTER)
-    dl_glow      = build_glow_list()
-    dl_milky_way = build_sky_sphere_list(TEX_MILKY_WAY, SKY_SPHERE_RADIUS)
-    dl_uranus  = build_sphere_list(TEX_URANUS,  R_URANUS)
-    dl_neptune = build_sphere_list(TEX_NEPTUNE, R_NEPTUNE)
+    # The pool is shut down (and joined) even if a texture fails to load
+    with ThreadPoolExecutor(max_workers=+4) as pool:
+        prefetch_textures(pool, [
+            (TEX_SUN, False, False), (TEX_MERCURY, False, False),
+            (TEX_VENUS, False, False), (TEX_EARTH_DAY, False, False),
+            (TEX_EARTH_NIGHT, False, False), (TEX_EARTH_CLOUDS, False, True),
+            (TEX_MOON, False, False), (TEX_MARS, False, False),
+            (TEX_JUPITER, False, False), (TEX_SATURN, False, False),
+            (TEX_SATURN_RING, True, False), (TEX_MILKY_WAY, False, False),
+            (TEX_URANUS, False, False), (TEX_NEPTUNE, False, False),
+        ])
+        sph_sun     = build_sphere(TEX_SUN,     R_SUN)
+        # Plain planets share one texture array when instancing is available
+        if not build_planet_batch():
+            sph_mercury = build_sphere(TEX_MERCURY, R_MERCURY)
+            sph_venus   = build_sphere(TEX_VENUS,   R_VENUS)
+            sph_mars    = build_sphere(TEX_MARS,    R_MARS)
+            sph_jupiter = build_sphere(TEX_JUPITER, R_JUPITER)
+            sph_uranus  = build_sphere(TEX_URANUS,  R_URANUS)
+            sph_neptune = build_sphere(TEX_NEPTUNE, R_NEPTUNE)
+        sph_earth_day   = build_sphere(TEX_EARTH_DAY,    R_EARTH)
+        sph_earth_night = build_sphere(TEX_EARTH_NIGHT,  R_EARTH)
+        sph_earth_cloud = build_sphere(TEX_EARTH_CLOUDS, R_EARTH * +1.015,
+                                       alpha_from_luminance=True)
+        sph_moon    = build_sphere(TEX_MOON,    R_MOON)
+        sph_saturn  = build_sphere(TEX_SATURN,  R_SATURN)
+        ring_saturn = build_ring(TEX_SATURN_RING,
+                                 SATURN_RING_INNER, SATURN_RING_OUTER)
+        sph_milky_way = build_sphere(TEX_MILKY_WAY, SKY_SPHERE_RADIUS)
     print("All textures loaded.")
 
-    # -- Starfield -------------------------------------------------------
+    # -- Starfield + orbit rings -----------------------------------------
     create_starfield()
+    build_orbit_rings_vbo()
 
     # -- Register callbacks ----------------------------------------------
     glutDisplayFunc(display)
-    glutIdleFunc(idle)
+    timer_armed = True
+    glutTimerFunc(FRAME_INTERVAL_MS, timer, +0)
+    glutVisibilityFunc(visibility)
     glutReshapeFunc(reshape)
     glutSpecialFunc(special_key_down)
     glutSpecialUpFunc(special_key_up)
     glutKeyboardFunc(normal_key_down)
     glutKeyboardUpFunc(normal_key_up)
+    # Held keys are tracked in keys_held, so auto-repeat events would
+    # only re-add the same key; ask GLUT not to deliver them at all
+    glutIgnoreKeyRepeat(+1)
 
     # -- Enter main loop -------------------------------------------------
     print("Controls: Arrows=orbit | +/-=zoom | Space=pause | H=reset | Esc=quit")